@@ -361,12 +361,12 @@ class BodyPartAdjustTool:
             content = f.read()
         
         # 建立新的 parts 字典字串
-        parts_lines = ["    'parts': {"]
-        for part_name in self.part_names:
-            coords = getattr(self.config, part_name)
-            parts_lines.append(f"        '{part_name}': {coords},")
-        parts_lines.append("    }")
-        new_parts_str = '\n'.join(parts_lines)
+        config = self.config
+        part_entries = '\n'.join(
+            f"        '{part_name}': {getattr(config, part_name)},"
+            for part_name in self.part_names
+        )
+        new_parts_str = f"    'parts': {{\n{part_entries}\n    }}"
         
         # 找到對應的 PROFILE 並替換
         profile_var = f"{self.profile_name.upper()}_PROFILE"
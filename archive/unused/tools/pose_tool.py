@@ -19,6 +19,15 @@ from animation import Poses
 from body_parts import BodyParts
 from skeleton import Skeleton, BodyPart
 
+# Built-in fallback poses, built once (apply_pose copies positions, so sharing is safe)
+HARDCODED_POSES = {
+    'block': Poses.get_block(),
+    'ready': Poses.get_ready(),
+    'punch': Poses.get_punch(),
+    'kick': Poses.get_kick(),
+    'jump': Poses.get_jump(),
+    'hurt': Poses.get_hurt()
+}
 
 pygame.init()
 
@@ -46,12 +55,18 @@ original_image = pygame.image.load(image_path).convert_alpha()
 body_parts_def = BodyParts()
 parts_dict = body_parts_def.get_all_parts()
 
-# Slice image
+# Slice image - parts are read-only views into the atlas (no pixel copy)
+atlas_rect = original_image.get_rect()
 part_images = {}
 for part_name, (x, y, w, h) in parts_dict.items():
-    part_surface = pygame.Surface((w, h), pygame.SRCALPHA)
-    part_surface.blit(original_image, (0, 0), (x, y, w, h))
-    part_images[part_name] = part_surface
+    part_rect = pygame.Rect(x, y, w, h)
+    if atlas_rect.contains(part_rect):
+        part_images[part_name] = original_image.subsurface(part_rect)
+    else:
+        # Rect sticks out of the atlas: copy into a padded transparent surface
+        part_surface = pygame.Surface((w, h), pygame.SRCALPHA)
+        part_surface.blit(original_image, (0, 0), part_rect)
+        part_images[part_name] = part_surface
 
 # Create skeleton
 skeleton = Skeleton()
@@ -118,7 +133,7 @@ skeleton.add_part(right_shin)
 skeleton.set_position(400, height / 2)
 
 # Apply Ready initial pose
-skeleton.apply_pose(Poses.get_ready())
+skeleton.apply_pose(HARDCODED_POSES['ready'])
 
 # Currently selected part
 part_names = ['torso', 'head', 'left_upper_arm', 'left_forearm',
@@ -152,23 +167,45 @@ save_message_timer = 0
 # Highlight mode
 highlight_selected = True
 
-# Use system Chinese font (smaller size) for Chinese text display
-try:
-    title_font = pygame.font.SysFont('microsoftyahei', 32, bold=True)
-    font = pygame.font.SysFont('microsoftyahei', 20)
-    small_font = pygame.font.SysFont('microsoftyahei', 16)
-    big_font = pygame.font.SysFont('microsoftyahei', 28)
-except:
+# Use system Chinese font (smaller size) for Chinese text display.
+# The resolved font path is cached so later runs skip the SysFont scan.
+FONT_CACHE_FILE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'pose_tool_font.txt')
+
+
+def resolve_font_path():
+    """Return a cached or freshly matched Chinese font path (None = default font)"""
     try:
-        title_font = pygame.font.SysFont('simhei', 32, bold=True)
-        font = pygame.font.SysFont('simhei', 20)
-        small_font = pygame.font.SysFont('simhei', 16)
-        big_font = pygame.font.SysFont('simhei', 28)
-    except:
-        title_font = pygame.font.Font(None, 32)
-        font = pygame.font.Font(None, 20)
-        small_font = pygame.font.Font(None, 16)
-        big_font = pygame.font.Font(None, 28)
+        with open(FONT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            path = f.read().strip()
+        if path and os.path.exists(path):
+            return path
+    except OSError:
+        pass
+
+    path = pygame.font.match_font('microsoftyahei,simhei')
+    if path:
+        try:
+            os.makedirs(os.path.dirname(FONT_CACHE_FILE), exist_ok=True)
+            with open(FONT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                f.write(path)
+        except OSError:
+            pass
+    return path
+
+
+font_path = resolve_font_path()
+try:
+    title_font = pygame.font.Font(font_path, 32)
+    title_font.set_bold(True)
+    font = pygame.font.Font(font_path, 20)
+    small_font = pygame.font.Font(font_path, 16)
+    big_font = pygame.font.Font(font_path, 28)
+except (OSError, pygame.error):
+    title_font = pygame.font.Font(None, 32)
+    font = pygame.font.Font(None, 20)
+    small_font = pygame.font.Font(None, 16)
+    big_font = pygame.font.Font(None, 28)
 
 clock = pygame.time.Clock()
 
@@ -288,16 +325,8 @@ def load_pose(pose_name):
     
     # Last resort: use hardcoded poses
     print(f"[WARN] Loading hardcoded pose for {pose_name}")
-    hardcoded_poses = {
-        'block': Poses.get_block(),
-        'ready': Poses.get_ready(),
-        'punch': Poses.get_punch(),
-        'kick': Poses.get_kick(),
-        'jump': Poses.get_jump(),
-        'hurt': Poses.get_hurt()
-    }
-    if pose_name in hardcoded_poses:
-        skeleton.apply_pose(hardcoded_poses[pose_name])
+    if pose_name in HARDCODED_POSES:
+        skeleton.apply_pose(HARDCODED_POSES[pose_name])
         return True
     
     print(f"[ERROR] Could not load pose: {pose_name}")
@@ -185,21 +185,22 @@ class AvatarCreateScene:
             else:
                 # fallback: find first matching image file in folder (accept guide.png.png etc.)
                 if os.path.isdir(base_dir):
-                    for name in os.listdir(base_dir):
-                        low = name.lower()
-                        if (
-                            low.endswith((".png", ".jpg", ".jpeg", ".webp"))
-                            and "guide" in low
-                        ):
-                            guide_path = os.path.join(base_dir, name)
-                            break
+                    # single directory scan: first guide-named image wins,
+                    # otherwise remember the first image as a fallback
+                    any_image = None
+                    with os.scandir(base_dir) as it:
+                        for entry in it:
+                            low = entry.name.lower()
+                            if not low.endswith((".png", ".jpg", ".jpeg", ".webp")) or not entry.is_file():
+                                continue
+                            if "guide" in low:
+                                guide_path = entry.path
+                                break
+                            if any_image is None:
+                                any_image = entry.path
                     # if still not found, pick any image
                     if guide_path is None:
-                        for name in os.listdir(base_dir):
-                            low = name.lower()
-                            if low.endswith((".png", ".jpg", ".jpeg", ".webp")):
-                                guide_path = os.path.join(base_dir, name)
-                                break
+                        guide_path = any_image
 
             if not guide_path or not os.path.exists(guide_path):
                 return None, None
@@ -14,7 +14,7 @@ from utils.color import (
     ORANGEYELLOW,
     GRAY,
 )
-from utils.ui import Button, draw_health_bar
+from utils.ui import Button, HealthBarRenderer
 from classes.player import Player
 
 # mediapipe capture helpers
@@ -30,7 +30,7 @@ try:
     from utils.action_detector import ActionDetector
 except Exception:
     # allow project to run even if opencv/mediapipe not available at import time
-    def start_mediapipe_capture():
+    def start_mediapipe_capture(show_preview=True):
         print("start_mediapipe_capture: mediapipe capture not available")
 
     def stop_mediapipe_capture():
@@ -115,6 +115,13 @@ class GameScene:
             image=back_img,
         )
 
+        # HUD health bars (P1 left, P2 right); their frames are pre-rendered
+        hud_margin, hud_top, bar_w, bar_h = 16, 100, 360, 20
+        self.p1_health_bar = HealthBarRenderer(pygame.Rect(hud_margin, hud_top, bar_w, bar_h))
+        self.p2_health_bar = HealthBarRenderer(
+            pygame.Rect(app.WIDTH - hud_margin - bar_w, hud_top, bar_w, bar_h)
+        )
+
         # Player entities with animation system
         # Player 1 使用 player1 的圖片，Player 2 使用 player2 的圖片
         self.player_1 = Player(
@@ -721,35 +728,26 @@ class GameScene:
 
         # draw HUD
         try:
-            w_margin = 16
-            h_margin = 100
-            bar_w = 360
-            bar_h = 20
-
             # Player 1 health bar (left)
-            p1_rect = pygame.Rect(w_margin, h_margin, bar_w, bar_h)
-            draw_health_bar(
+            p1_rect = self.p1_health_bar.rect
+            self.p1_health_bar.draw(
                 self.screen,
-                p1_rect,
                 self.player_1.health_points,
                 self.player_1.max_health_points,
             )
             lbl1 = self.font.render("P1", True, TITLE)
-            self.screen.blit(lbl1, (p1_rect.right + 8, h_margin - 2))
+            self.screen.blit(lbl1, (p1_rect.right + 8, p1_rect.top - 2))
 
             # Player 2 health bar (right)
-            p2_rect = pygame.Rect(
-                self.app.WIDTH - w_margin - bar_w, h_margin, bar_w, bar_h
-            )
-            draw_health_bar(
+            p2_rect = self.p2_health_bar.rect
+            self.p2_health_bar.draw(
                 self.screen,
-                p2_rect,
                 self.player_2.health_points,
                 self.player_2.max_health_points,
             )
             lbl2 = self.font.render("P2", True, TITLE)
             lbl2_rect = lbl2.get_rect()
-            self.screen.blit(lbl2, (p2_rect.left - lbl2_rect.width - 8, h_margin - 2))
+            self.screen.blit(lbl2, (p2_rect.left - lbl2_rect.width - 8, p2_rect.top - 2))
 
             # 回合時間
             time_text = self.title_font.render(f"{int(self.round_time)}", True, TITLE)
@@ -2,7 +2,7 @@ import pygame
 import os
 
 from utils.color import BG, TITLE, START_BASE, START_HOVER, QUIT_BASE, QUIT_HOVER, STATUS
-from utils.ui import Button
+from utils.ui import Button, draw_buttons
 
 
 class MenuScene:
@@ -152,8 +152,7 @@ class MenuScene:
         #self.screen.blit(title_surf, title_rect)
 
         mouse_pos = pygame.mouse.get_pos()
-        self.start_button.draw(self.screen, mouse_pos)
-        self.quit_button.draw(self.screen, mouse_pos)
+        draw_buttons(self.screen, (self.start_button, self.quit_button), mouse_pos)
         # self.dev_game_button.draw(self.screen, mouse_pos)
         # self.pose_editor_button.draw(self.screen, mouse_pos)
 
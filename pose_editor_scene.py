@@ -3,7 +3,7 @@ import os
 import json
 
 from utils.color import BG, TITLE
-from utils.ui import Button
+from utils.ui import Button, draw_buttons
 from classes.animated_character import AnimatedCharacter
 
 
@@ -334,8 +334,7 @@ class PoseEditorScene:
         # draw UI
         mouse_pos = pygame.mouse.get_pos()
         try:
-            self.back_button.draw(self.screen, mouse_pos)
-            self.save_button.draw(self.screen, mouse_pos)
+            draw_buttons(self.screen, (self.back_button, self.save_button), mouse_pos)
         except Exception:
             pass
 
@@ -16,7 +16,17 @@ from tutorial_scene import TutorialScene
 
 class Application:
     def __init__(self, width=1024, height=768):
+        # mixer settings used by the game scene SFX; applied by pygame.init()
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
         pygame.init()
+        # initialize the mixer exactly once here so scenes don't re-check it
+        # on every on_enter
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            pygame.mixer.set_num_channels(16)
+        except Exception:
+            print("Application: audio mixer unavailable")
         self.WIDTH = width
         self.HEIGHT = height
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
@@ -2,9 +2,18 @@ import pygame
 import os
 
 from utils.color import BG, TITLE,START_BASE,START_HOVER, QUIT_BASE, QUIT_HOVER,NEXT_BASE,NEXT_HOVER,PREV_BASE,PREV_HOVER
-from utils.ui import Button
-from utils.gif_player import GifPlayer
+from utils.ui import Button, draw_buttons
+from utils.gif_player import load_gif_player
 
+# scaled tutorial frames kept at once; the eager GifPlayer limit (64 frames)
+# fits, streaming players just refill it
+_TUT_SCALE_CACHE_MAX = 64
+
+
+# fallback music when no ResourceManager audio is configured; existence is
+# checked once at import instead of on every scene entry
+MUSIC_PATH = os.path.join('assets', 'sounds', 'game_bgm.mp3')
+MUSIC_EXISTS = os.path.exists(MUSIC_PATH)
 
 class TutorialScene:
     def __init__(self, app):
@@ -83,9 +92,11 @@ class TutorialScene:
             hover_color=PREV_HOVER,
             image=prev_img,
         )
+        # draw order for render()
+        self._buttons = (self.back_button, self.start_button, self.next_button, self.prev_button)
 
         # Load tutorial assets. If an asset is a GIF file we create a GifPlayer
-        # instance which will produce animated frames; otherwise we use the
+        # (streaming for long GIFs) which will produce animated frames; otherwise we use the
         # already-loaded pygame.Surface returned by ResourceManager.
         def _load_asset(key):
             # prefer the raw mapped path so we can detect GIFs
@@ -97,7 +108,7 @@ class TutorialScene:
 
             if path and isinstance(path, str) and path.lower().endswith('.gif'):
                 try:
-                    gp = GifPlayer(path)
+                    gp = load_gif_player(path)
                     if gp.is_valid():
                         return gp
                 except Exception:
@@ -110,19 +121,40 @@ class TutorialScene:
             except Exception:
                 return None
 
-        self.tutorial_images = {
-            "jump": _load_asset("tutorial_jump"),
-            "punch": _load_asset("tutorial_punch"),
-            "kick": _load_asset("tutorial_kick"),
-            "block": _load_asset("tutorial_block"),
-        }
-        self.current_tutorial = "jump"
-        self.current_tutorial_image = self.tutorial_images.get(self.current_tutorial)
-        
+        # parallel name/asset sequences indexed by self._tut_idx
+        self._tut_names = ("jump", "punch", "kick", "block")
+        self._tut_assets = [_load_asset(f"tutorial_{name}") for name in self._tut_names]
+        self._tut_idx = 0
+        # per-asset update callables (None for static images) so update()
+        # needs no reflection or exception handling per frame
+        self._updaters = tuple(getattr(asset, 'update', None) for asset in self._tut_assets)
+
+        # static text never changes for the scene lifetime: render it once
+        self._title_surf = self.title_font.render("Tutorial", True, TITLE)
+        self._title_rect = self._title_surf.get_rect(center=(app.WIDTH // 2, 70))
+        self._name_surfs = [self.font.render(name.capitalize(), True, TITLE) for name in self._tut_names]
+        self._name_rects = [surf.get_rect(center=(app.WIDTH // 2, 120)) for surf in self._name_surfs]
+
+        # background surface is fetched once; ResourceManager never swaps it
+        try:
+            self._bg_image = self.res_mgr.get_image("game_background")
+        except Exception:
+            self._bg_image = None
+
+        # scaled-surface caches: the background only changes with window size;
+        # tutorial GIF frames are smoothscaled once each, the first time they
+        # are shown, and kept per source frame for the current window size
+        self._scaled_bg = None
+        self._scaled_bg_key = None
+        self._scaled_tut = {}
+        self._scaled_tut_size = None
 
         self.started = False
 
     def handle_event(self, event):
+        # buttons only react to mouse clicks; skip polling them for anything else
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
         if self.start_button.handle_event(event):
             # switch to Game scene when Start is clicked
             self.app.change_scene("GameScene")
@@ -130,22 +162,10 @@ class TutorialScene:
             self.app.change_scene("MenuScene")
         if self.next_button.handle_event(event):
             # switch to next tutorial image
-            keys = list(self.tutorial_images.keys())
-            try:
-                idx = keys.index(self.current_tutorial)
-                idx = (idx + 1) % len(keys)
-                self.current_tutorial = keys[idx]
-            except Exception:
-                self.current_tutorial = keys[0]
+            self._tut_idx = (self._tut_idx + 1) % len(self._tut_names)
         if self.prev_button.handle_event(event):
             # switch to previous tutorial image
-            keys = list(self.tutorial_images.keys())
-            try:
-                idx = keys.index(self.current_tutorial)
-                idx = (idx - 1) % len(keys)
-                self.current_tutorial = keys[idx]
-            except Exception:
-                self.current_tutorial = keys[0]
+            self._tut_idx = (self._tut_idx - 1) % len(self._tut_names)
 
     def on_enter(self):
         # play menu background music (prefer ResourceManager if available)
@@ -161,33 +181,23 @@ class TutorialScene:
                     # fall back to direct mixer below
                     pass
             else:
-                # ensure mixer is initialized then load and play the file directly
-                try:
-                    if not pygame.mixer.get_init():
-                        pygame.mixer.init()
-                except Exception:
+                # mixer is initialized once by Application; load and play directly
+                if MUSIC_EXISTS:
                     try:
-                        pygame.mixer.init()
-                    except Exception:
-                        pass
-
-                music_path = os.path.join('assets', 'sounds', 'game_bgm.mp3')
-                if os.path.exists(music_path):
-                    try:
-                        pygame.mixer.music.load(music_path)
+                        pygame.mixer.music.load(MUSIC_PATH)
                         pygame.mixer.music.set_volume(0.5)
                         # fade in over 500ms
                         pygame.mixer.music.play(-1, 0.0, 500)
                     except Exception as e:
-                        print(f"MenuScene: failed to play music '{music_path}':", e)
+                        print(f"MenuScene: failed to play music '{MUSIC_PATH}':", e)
                 else:
-                    print(f"MenuScene: music file not found: {music_path}")
+                    print(f"MenuScene: music file not found: {MUSIC_PATH}")
         except Exception:
             pass
 
         # Ensure tutorial GIFs start from the beginning and play when entering the scene
         try:
-            for val in self.tutorial_images.values():
+            for val in self._tut_assets:
                 if hasattr(val, 'reset'):
                     try:
                         val.reset()
@@ -210,24 +220,25 @@ class TutorialScene:
 
     def update(self, dt):
         # advance GIF players if present
-        try:
-            val = self.tutorial_images.get(self.current_tutorial)
-            if hasattr(val, 'update'):
-                try:
-                    val.update(dt)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        updater = self._updaters[self._tut_idx]
+        if updater is not None:
+            updater(dt)
 
     def render(self):
         # draw background image or color
         try:
-            bg_image = self.res_mgr.get_image("game_background")
+            bg_image = self._bg_image
             if bg_image:
                 # protect against invalid surfaces
-                scaled = pygame.transform.smoothscale(bg_image, (self.app.WIDTH, self.app.HEIGHT))
-                self.screen.blit(scaled, (0, 0))
+                key = (id(bg_image), self.app.WIDTH, self.app.HEIGHT)
+                if key != self._scaled_bg_key:
+                    if bg_image.get_size() == (self.app.WIDTH, self.app.HEIGHT):
+                        # already screen-sized: blit the source, no scaled copy
+                        self._scaled_bg = bg_image
+                    else:
+                        self._scaled_bg = pygame.transform.smoothscale(bg_image, (self.app.WIDTH, self.app.HEIGHT))
+                    self._scaled_bg_key = key
+                self.screen.blit(self._scaled_bg, (0, 0))
             else:
                 self.screen.fill(BG)
         except Exception:
@@ -236,7 +247,7 @@ class TutorialScene:
 
         # draw current tutorial image in center
         try:
-            val = self.tutorial_images.get(self.current_tutorial)
+            val = self._tut_assets[self._tut_idx]
             img = None
             # GifPlayer exposes get_surface(); static surfaces are blitted directly
             if val is None:
@@ -250,52 +261,50 @@ class TutorialScene:
                 img = val
 
             if img:
-                # Scale the tutorial image to at most 60% of the screen while
-                # preserving aspect ratio. Do not upscale small images.
-                orig_w, orig_h = img.get_size()
-                max_w = int(self.app.WIDTH * 0.6)
-                max_h = int(self.app.HEIGHT * 0.6)
-                # guard against zero sizes
-                if orig_w <= 0 or orig_h <= 0:
+                size = (self.app.WIDTH, self.app.HEIGHT)
+                # keyed by the surface itself (not its id) so a frame a streaming
+                # GIF evicted can't alias a newly decoded one; streaming players
+                # decode fresh surfaces, so the cache is bounded
+                if size != self._scaled_tut_size or len(self._scaled_tut) > _TUT_SCALE_CACHE_MAX:
+                    self._scaled_tut.clear()
+                    self._scaled_tut_size = size
+                cached = self._scaled_tut.get(img)
+                if cached is None:
+                    # Scale the tutorial image to at most 60% of the screen while
+                    # preserving aspect ratio. Do not upscale small images.
+                    orig_w, orig_h = img.get_size()
+                    max_w = int(self.app.WIDTH * 0.6)
+                    max_h = int(self.app.HEIGHT * 0.6)
                     scaled_img = img
-                else:
-                    scale = min(max_w / orig_w, max_h / orig_h, 1.0)
-                    new_w = max(1, int(orig_w * scale))
-                    new_h = max(1, int(orig_h * scale))
-                    if new_w != orig_w or new_h != orig_h:
-                        try:
-                            scaled_img = pygame.transform.smoothscale(img, (new_w, new_h))
-                        except Exception:
-                            scaled_img = pygame.transform.scale(img, (new_w, new_h))
-                    else:
-                        scaled_img = img
-
-                img_rect = scaled_img.get_rect(center=(self.app.WIDTH // 2, self.app.HEIGHT // 2))
-                self.screen.blit(scaled_img, img_rect)
+                    # guard against zero sizes
+                    if orig_w > 0 and orig_h > 0:
+                        scale = min(max_w / orig_w, max_h / orig_h, 1.0)
+                        new_w = max(1, int(orig_w * scale))
+                        new_h = max(1, int(orig_h * scale))
+                        if new_w != orig_w or new_h != orig_h:
+                            # frames mix a dithered photo with pixel art and
+                            # shrink by a non-integer ratio, so filter them
+                            try:
+                                scaled_img = pygame.transform.smoothscale(img, (new_w, new_h))
+                            except (ValueError, pygame.error):
+                                # smoothscale only takes 24/32-bit surfaces
+                                scaled_img = pygame.transform.scale(img, (new_w, new_h))
+                    cached = (scaled_img, scaled_img.get_rect(center=(self.app.WIDTH // 2, self.app.HEIGHT // 2)))
+                    self._scaled_tut[img] = cached
+                self.screen.blit(*cached)
         except Exception:
             # if anything goes wrong drawing the tutorial image, ignore and continue
             pass
         
 
         # title
-        title_surf = self.title_font.render("Tutorial", True, TITLE)
-        title_rect = title_surf.get_rect(center=(self.app.WIDTH // 2, 70))
-        self.screen.blit(title_surf, title_rect)
+        self.screen.blit(self._title_surf, self._title_rect)
 
         # show the name of current tutorial
-        try:
-            tutorial_name = self.current_tutorial.capitalize()
-            tutorial_surf = self.font.render(f"{tutorial_name}", True, TITLE)
-            tutorial_rect = tutorial_surf.get_rect(center=(self.app.WIDTH // 2, 120))
-            self.screen.blit(tutorial_surf, tutorial_rect)
-        except Exception:
-            pass
+        self.screen.blit(self._name_surfs[self._tut_idx], self._name_rects[self._tut_idx])
 
-        mouse_pos = pygame.mouse.get_pos()
-        self.back_button.draw(self.screen, mouse_pos)
-        self.start_button.draw(self.screen, mouse_pos)
-        self.next_button.draw(self.screen, mouse_pos)
-        self.prev_button.draw(self.screen, mouse_pos)
+        # query the mouse once, then draw all buttons in one batch
+        draw_buttons(self.screen, self._buttons, pygame.mouse.get_pos())
 
 
 
@@ -1,53 +1,206 @@
 """Simple real-time action detector using MediaPipe Pose.
 
-This module provides ActionDetector which runs a background thread
-capturing camera frames and uses heuristics on pose landmarks to detect
-three actions: 'punch', 'kick', 'jump', and 'block'. When an action is
-detected it invokes a provided callback with (player_id, action_name).
-
-It supports a low-cost multi-person approach by running the single-person
-MediaPipe Pose on left/right crops. If the project's
-`utils/mediapipe_capture` singleton exists, ActionDetector will prefer to
-read landmarks from it instead of opening the camera directly.
+This module provides ActionDetector which runs a background thread reading
+pose landmarks from the shared `utils/mediapipe_capture` camera and uses
+heuristics on them to detect three actions: 'punch', 'kick', 'jump', and
+'block'. When an action is detected it invokes a provided callback with
+(player_id, action_name). Players are told apart by which half of the frame
+the nose is in.
 """
 from __future__ import annotations
 
 import threading
 import time
-from typing import Callable, Optional, Tuple
-import cv2
-import math
+from collections import deque
+from typing import Callable, List, Optional
+import numpy as np
 
 try:
-    import mediapipe as mp
+    import utils.mediapipe_capture as mc
 except Exception:
-    mp = None
+    mc = None
 
+# numba is optional: when present the detection kernel below is JIT-compiled,
+# otherwise it runs as plain Python with identical results
 try:
-    import utils.mediapipe_capture as mc
+    from numba import njit
 except Exception:
-    mc = None
+    njit = None
+
+
+# MediaPipe Pose landmark indices (fixed by the model topology), resolved once
+# here instead of walking mp_pose.PoseLandmark.X.value on every detection call
+NOSE = 0
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+LEFT_ELBOW = 13
+RIGHT_ELBOW = 14
+LEFT_WRIST = 15
+RIGHT_WRIST = 16
+LEFT_HIP = 23
+RIGHT_HIP = 24
+LEFT_ANKLE = 27
+RIGHT_ANKLE = 28
+NUM_LANDMARKS = 33
+
+
+# action codes returned by _detect_action
+ACTION_SKIP = -1  # punch-like motion without arm extension: report nothing
+ACTION_NONE = 0   # no action: player is READY
+ACTION_BLOCK = 1
+ACTION_PUNCH = 2
+ACTION_KICK = 3
+ACTION_JUMP = 4
+ACTION_NAMES = (None, 'block', 'punch', 'kick', 'jump')
+
+# slots of the thresholds array passed to _detect_action
+TH_BLOCK_WRIST_DIST = 0
+TH_BLOCK_CHEST_Y = 1
+TH_PUNCH_DISP = 2
+TH_PUNCH_VEL = 3
+TH_ELBOW_COS = 4
+TH_KICK_HEIGHT = 5
+TH_KICK_Z = 6
+TH_JUMP_HEIGHT = 7
+NUM_THRESHOLDS = 8
+
+# columns of the per-player state array (one row per player); timestamps
+# live in separate int fields so monotonic_ns values stay exact
+STATE_WRIST_X = 0
+STATE_HIP_BASELINE = 1
+NUM_STATE = 2
+
+
+def _detect_action(lm, player_id, vel_x, hip_baseline, th):
+    """Classify one landmark set into an ACTION_* code.
+
+    Pure numeric kernel: `lm` is the (N, 3) landmark array, `vel_x` the wrist
+    velocity, `hip_baseline` the standing hip y (NaN if unknown) and `th` a
+    float array indexed by the TH_* slots. Checks run in priority order
+    block, punch, kick, jump.
+    """
+    if player_id == 0:
+        shoulder = LEFT_SHOULDER
+        wrist = LEFT_WRIST
+        hip = LEFT_HIP
+        elbow = LEFT_ELBOW
+        facing_dir = 1.0
+    else:
+        shoulder = RIGHT_SHOULDER
+        wrist = RIGHT_WRIST
+        hip = RIGHT_HIP
+        elbow = RIGHT_ELBOW
+        facing_dir = -1.0
+
+    # BLOCK: wrists close together at chest height (squared distance, no sqrt)
+    dx = lm[LEFT_WRIST, 0] - lm[RIGHT_WRIST, 0]
+    dy = lm[LEFT_WRIST, 1] - lm[RIGHT_WRIST, 1]
+    block_dist = th[TH_BLOCK_WRIST_DIST]
+    shoulder_y = 0.5 * (lm[LEFT_SHOULDER, 1] + lm[RIGHT_SHOULDER, 1])
+    wrist_y_avg = 0.5 * (lm[LEFT_WRIST, 1] + lm[RIGHT_WRIST, 1])
+    if dx * dx + dy * dy < block_dist * block_dist and abs(wrist_y_avg - shoulder_y) < th[TH_BLOCK_CHEST_Y]:
+        return ACTION_BLOCK
+
+    # PUNCH: wrist ahead of shoulder and moving forward fast, arm extended
+    punch_disp = (lm[wrist, 0] - lm[shoulder, 0]) * facing_dir
+    if punch_disp > th[TH_PUNCH_DISP] and vel_x * facing_dir > th[TH_PUNCH_VEL]:
+        # elbow angle: upper arm vs forearm vectors around the elbow
+        ax = lm[shoulder, 0] - lm[elbow, 0]
+        ay = lm[shoulder, 1] - lm[elbow, 1]
+        bx = lm[wrist, 0] - lm[elbow, 0]
+        by = lm[wrist, 1] - lm[elbow, 1]
+        na2 = ax * ax + ay * ay
+        nb2 = bx * bx + by * by
+        if na2 > 1e-12 and nb2 > 1e-12:
+            # cos(angle) < c without the square roots: compare dot^2 against
+            # c^2 * |a|^2 * |b|^2, guarding on the signs of dot and c
+            dot = ax * bx + ay * by
+            cos_th = th[TH_ELBOW_COS]
+            lim2 = cos_th * cos_th * na2 * nb2
+            if cos_th < 0.0:
+                extended = dot < 0.0 and dot * dot > lim2
+            else:
+                extended = dot < 0.0 or dot * dot < lim2
+            if not extended:
+                return ACTION_SKIP
+        return ACTION_PUNCH
+
+    # KICK: either ankle raised toward hip height or pushed toward the camera
+    # (z is NaN when depth is unavailable, so the forward check is False)
+    hip_y_ref = 0.5 * (lm[LEFT_HIP, 1] + lm[RIGHT_HIP, 1])
+    hip_z_ref = 0.5 * (lm[LEFT_HIP, 2] + lm[RIGHT_HIP, 2])
+    for ankle in (LEFT_ANKLE, RIGHT_ANKLE):
+        if (hip_y_ref - lm[ankle, 1]) > th[TH_KICK_HEIGHT] or (hip_z_ref - lm[ankle, 2]) > th[TH_KICK_Z]:
+            return ACTION_KICK
+
+    # JUMP: hip risen above its standing baseline
+    if (hip_baseline - lm[hip, 1]) > th[TH_JUMP_HEIGHT]:
+        return ACTION_JUMP
+
+    return ACTION_NONE
+
+
+if njit is not None:
+    # no fastmath: the kernel relies on NaN comparisons evaluating to False
+    _detect_action = njit(cache=True)(_detect_action)
+
+
+def _as_landmark_array(lm_list) -> Optional[np.ndarray]:
+    """Pack a landmark sequence into a contiguous (N, 3) float array.
+
+    Rows are (x, y, z); z is NaN when the producer only supplied (x, y), so
+    depth comparisons on it simply evaluate to False.
+    """
+    try:
+        arr = np.asarray(lm_list, dtype=np.float64)
+    except (TypeError, ValueError):
+        # ragged rows or None entries: fill row by row
+        arr = np.full((len(lm_list), 3), np.nan)
+        for i, v in enumerate(lm_list):
+            for j in range(min(3, len(v))):
+                if v[j] is not None:
+                    arr[i, j] = v[j]
+        return arr
+    if arr.ndim != 2 or arr.shape[1] < 2:
+        return None
+    if arr.shape[1] == 2:
+        arr = np.column_stack((arr, np.full(arr.shape[0], np.nan)))
+    return arr[:, :3]
 
 
 class ActionDetector:
+    __slots__ = (
+        'callback', 'camera_index', '_running', '_thread', '_set_action', '_state',
+        '_last_ns', '_cooldown_until_ns',
+        'punch_vel_threshold', 'punch_disp_threshold', 'kick_height_threshold',
+        'kick_z_threshold', 'jump_height_threshold', 'cooldown_seconds',
+        'block_wrist_dist_threshold', 'block_chest_y_thresh',
+        'elbow_extension_cos_threshold', '_thresholds', '_cooldown_ns',
+        'stats_log_interval', '_metrics',
+    )
+
     def __init__(self, callback: Callable[[int, str], None], camera_index: int = 0):
         """Create an ActionDetector.
 
-        callback: function(player_id: int, action_name: str)
-        camera_index: index passed to cv2.VideoCapture when not using mediapipe_capture
+        callback: function(player_id: int, action_name: str); it runs on the
+            detector thread and should not raise
+        camera_index: kept for API compatibility; landmarks always come from
+            the shared `utils.mediapipe_capture` camera
         """
         self.callback = callback
         self.camera_index = camera_index
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
-        self._use_mc = False
+        # mc.set_latest_action, resolved once per run (None when unavailable)
+        self._set_action: Optional[Callable[[int, str], None]] = None
 
-        # per-player state
-        self._last_wrist_x = {0: None, 1: None}
-        self._last_time = {0: None, 1: None}
-        self._cooldown_until = {0: 0.0, 1: 0.0}
-        self._hip_baseline = {0: None, 1: None}
+        # per-player state, indexed [player_id, STATE_*]; NaN means not seen yet
+        self._state = np.full((2, NUM_STATE), np.nan, dtype=np.float64)
+        # per-player time.monotonic_ns() of the last sample (None until seen)
+        # and of the end of the action cooldown
+        self._last_ns: List[Optional[int]] = [None, None]
+        self._cooldown_until_ns = [0, 0]
 
         # thresholds (tweak as needed)
         self.punch_vel_threshold = 0.15
@@ -62,26 +215,75 @@ class ActionDetector:
         self.block_chest_y_thresh = 0.16
         self.elbow_extension_cos_threshold = -0.8
 
-        # processing throttling (frames per second to actually run the Pose model)
-        # Lowering this reduces CPU usage. Set to None or 0 to process every frame.
-        self.process_fps = 10
-        # optional downscale factor applied to each crop before feeding to Pose.
-        # Values in (0,1] — smaller reduces CPU but may reduce accuracy.
-        self.crop_scale = 0.7
-        # internal tracker
-        self._last_process_time = 0.0
+        # kernel inputs snapshotted from the attributes above when a run starts
+        self._thresholds = np.empty(NUM_THRESHOLDS, dtype=np.float64)
+        self._cooldown_ns = 0
+
+        # counters and rolling windows behind stats(); only the detector
+        # thread writes them
+        self._metrics = {
+            'frames': 0,
+            'actions': 0,
+            'cooldown_blocks': 0,
+            'misses': 0,
+            'lag_ms': deque(maxlen=128),
+            'frame_times': deque(maxlen=128),
+        }
+        # seconds between stats() log lines from the detector thread; None disables
+        self.stats_log_interval: Optional[float] = None
+
+    def stats(self) -> dict:
+        """Return detection counters plus rolling FPS and capture-to-detection lag.
+
+        - frames: poses processed
+        - actions: actions delivered to the callback
+        - cooldown_blocks: poses skipped because the player was in cooldown
+        - misses: waits/polls that found no new pose
+        - fps: processing rate over the last 128 poses
+        - lag_ms_avg / lag_ms_max: delay from the capture loop taking a frame
+          (before pose inference) to its detection, over the same window;
+          excludes only the camera read itself
+        """
+        m = self._metrics
+        times = list(m['frame_times'])
+        lags = list(m['lag_ms'])
+        fps = 0.0
+        if len(times) > 1 and times[-1] > times[0]:
+            fps = (len(times) - 1) * 1e9 / (times[-1] - times[0])
+        return {
+            'frames': m['frames'],
+            'actions': m['actions'],
+            'cooldown_blocks': m['cooldown_blocks'],
+            'misses': m['misses'],
+            'fps': fps,
+            'lag_ms_avg': sum(lags) / len(lags) if lags else 0.0,
+            'lag_ms_max': max(lags, default=0.0),
+        }
+
+    def _record_frame(self, now: int, lag_ms: float):
+        m = self._metrics
+        m['frames'] += 1
+        m['frame_times'].append(now)
+        m['lag_ms'].append(lag_ms)
+
+    def _emit(self, player_id: int, action: str, mirror: bool = True):
+        """Deliver a detected action to the callback and, if `mirror`, the capture overlay."""
+        self._metrics['actions'] += 1
+        self.callback(player_id, action)
+        if mirror and self._set_action is not None:
+            self._set_action(player_id, action.upper())
 
     def start(self):
         if self._running:
             return
-        if mp is None:
-            print("ActionDetector: mediapipe not available")
+        if mc is None or not hasattr(mc, 'get_latest_landmarks'):
+            print("ActionDetector: mediapipe_capture not available")
             return
-        try:
-            if mc and hasattr(mc, 'get_latest_landmarks'):
-                self._use_mc = True
-        except Exception:
-            self._use_mc = False
+        is_running = getattr(mc, 'is_mediapipe_capture_running', None)
+        if is_running is not None and not is_running():
+            # the detector never opens the camera itself, so there is only ever
+            # one Pose graph; it just idles until the capture is started
+            print("ActionDetector: mediapipe capture is not running yet; waiting for landmarks")
 
         self._running = True
         self._thread = threading.Thread(target=self._run, daemon=True)
@@ -93,314 +295,143 @@ class ActionDetector:
             self._thread.join(timeout=1.0)
             self._thread = None
 
-    def _run(self):
-        mp_pose = mp.solutions.pose
+    def _process_landmarks(self, lm: np.ndarray, now: int):
+        """Run the action heuristics on one pose.
 
-        def _get_point(lm_list, idx: int):
-            """Return landmark at idx as (x,y) or (x,y,z) depending on availability."""
-            try:
-                v = lm_list[idx]
-                # support (x,y) or (x,y,z)
-                if hasattr(v, '__len__') and len(v) >= 3:
-                    return (v[0], v[1], v[2])
-                return (v[0], v[1])
-            except Exception:
-                return None
-
-        def _run_detection_for_landmarks(lm_list: list, assumed_player: Optional[int] = None):
-            # lm_list is a sequence of (x,y) normalized to full-frame coordinates
-            nose = _get_point(lm_list, mp_pose.PoseLandmark.NOSE.value)
-            left_shoulder = _get_point(lm_list, mp_pose.PoseLandmark.LEFT_SHOULDER.value)
-            right_shoulder = _get_point(lm_list, mp_pose.PoseLandmark.RIGHT_SHOULDER.value)
-            left_wrist = _get_point(lm_list, mp_pose.PoseLandmark.LEFT_WRIST.value)
-            right_wrist = _get_point(lm_list, mp_pose.PoseLandmark.RIGHT_WRIST.value)
-            left_elbow = _get_point(lm_list, mp_pose.PoseLandmark.LEFT_ELBOW.value)
-            right_elbow = _get_point(lm_list, mp_pose.PoseLandmark.RIGHT_ELBOW.value)
-            left_hip = _get_point(lm_list, mp_pose.PoseLandmark.LEFT_HIP.value)
-            right_hip = _get_point(lm_list, mp_pose.PoseLandmark.RIGHT_HIP.value)
-            left_ankle = _get_point(lm_list, mp_pose.PoseLandmark.LEFT_ANKLE.value)
-            right_ankle = _get_point(lm_list, mp_pose.PoseLandmark.RIGHT_ANKLE.value)
-
-            now = time.time()
-
-            # decide player id
-            if assumed_player is not None:
-                player_id = assumed_player
-            else:
-                if nose is None:
-                    return
-                player_id = 0 if nose[0] < 0.5 else 1
-
-            if player_id == 0:
-                shoulder = left_shoulder
-                wrist = left_wrist
-                hip = left_hip
-                ankle = left_ankle
-                left_el = left_elbow
-                right_el = right_elbow
-                facing_dir = 1.0
-            else:
-                shoulder = right_shoulder
-                wrist = right_wrist
-                hip = right_hip
-                ankle = right_ankle
-                left_el = left_elbow
-                right_el = right_elbow
-                facing_dir = -1.0
-
-            # init baseline
-            if hip and self._hip_baseline[player_id] is None:
-                self._hip_baseline[player_id] = hip[1]
-
-            prev_x = self._last_wrist_x[player_id]
-            prev_t = self._last_time[player_id]
-            self._last_time[player_id] = now
-            if wrist:
-                self._last_wrist_x[player_id] = wrist[0]
-
-            vel_x = 0.0
-            if prev_x is not None and prev_t is not None and wrist:
-                dt = max(1e-3, now - prev_t)
-                vel_x = (wrist[0] - prev_x) / dt
-
-            if now < self._cooldown_until[player_id]:
-                return
-
-            # BLOCK detection
-            try:
-                lw = left_wrist
-                rw = right_wrist
-                ls = left_shoulder
-                rs = right_shoulder
-                if lw and rw and ls and rs:
-                    dist = math.hypot(lw[0] - rw[0], lw[1] - rw[1])
-                    shoulder_y = 0.5 * (ls[1] + rs[1])
-                    wrist_y_avg = 0.5 * (lw[1] + rw[1])
-                    if dist < self.block_wrist_dist_threshold and abs(wrist_y_avg - shoulder_y) < self.block_chest_y_thresh:
-                        self._cooldown_until[player_id] = now + self.cooldown_seconds
-                        try:
-                            self.callback(player_id, 'block')
-                            if mc and hasattr(mc, 'set_latest_action'):
-                                try:
-                                    mc.set_latest_action(player_id, 'BLOCK')
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                        return
-            except Exception:
-                pass
+        `lm` is an (N, 3) array of (x, y, z) normalized to full-frame
+        coordinates and `now` a time.monotonic_ns() timestamp.
+        """
+        if lm is None or lm.shape[0] < NUM_LANDMARKS:
+            return
 
-            # PUNCH detection
-            punch_disp = None
-            if wrist and shoulder:
-                punch_disp = (wrist[0] - shoulder[0]) * facing_dir
+        # decide player id
+        player_id = 0 if lm[NOSE, 0] < 0.5 else 1
 
-            if punch_disp is not None and punch_disp > self.punch_disp_threshold and vel_x * facing_dir > self.punch_vel_threshold:
-                try:
-                    elbow = left_el if player_id == 0 else right_el
-                    shoulder_pt = left_shoulder if player_id == 0 else right_shoulder
-                    wrist_pt = left_wrist if player_id == 0 else right_wrist
-                    extended_ok = True
-                    # print("[Develop Log] Punch detected, checking elbow extension")
-                    if elbow and shoulder_pt and wrist_pt:
-                        # print("[Develop Log] Calculating elbow angle for extension check")  
-                        ax = shoulder_pt[0] - elbow[0]
-                        ay = shoulder_pt[1] - elbow[1]
-                        bx = wrist_pt[0] - elbow[0]
-                        by = wrist_pt[1] - elbow[1]
-                        na = math.hypot(ax, ay)
-                        nb = math.hypot(bx, by)
-                        if na > 1e-6 and nb > 1e-6:
-                            dot = (ax * bx + ay * by) / (na * nb)
-                            extended_ok = (dot < self.elbow_extension_cos_threshold)
-                    if not extended_ok:
-                        return
-
-                    self._cooldown_until[player_id] = now + self.cooldown_seconds
-                    try:
-                        self.callback(player_id, 'punch')
-                        if mc and hasattr(mc, 'set_latest_action'):
-                            try:
-                                mc.set_latest_action(player_id, 'PUNCH')
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-                    return
-                except Exception:
-                    try:
-                        self._cooldown_until[player_id] = now + self.cooldown_seconds
-                        self.callback(player_id, 'punch')
-                    except Exception:
-                        pass
-                    return
-
-            # KICK detection - consider either leg (left or right ankle) raised
-            try:
-                # determine a robust hip reference: prefer mean of both hips if available
-                hip_y_ref = None
-                if left_hip and right_hip:
-                    hip_y_ref = 0.5 * (left_hip[1] + right_hip[1])
-                elif hip:
-                    hip_y_ref = hip[1]
-
-                # robust hip z reference if available
-                hip_z_ref = None
-                try:
-                    if left_hip and len(left_hip) >= 3 and right_hip and len(right_hip) >= 3:
-                        hip_z_ref = 0.5 * (left_hip[2] + right_hip[2])
-                    elif hip and len(hip) >= 3:
-                        hip_z_ref = hip[2]
-                except Exception:
-                    hip_z_ref = None
-
-                if hip_y_ref is not None or hip_z_ref is not None:
-                    # check both ankles if present
-                    candidate_ankles = []
-                    if left_ankle:
-                        candidate_ankles.append(left_ankle)
-                    if right_ankle:
-                        candidate_ankles.append(right_ankle)
-
-                    for ank in candidate_ankles:
-                        ank_y = ank[1] if ank and len(ank) >= 2 else None
-                        ank_z = ank[2] if ank and len(ank) >= 3 else None
-
-                        vertical_ok = hip_y_ref is not None and ank_y is not None and (hip_y_ref - ank_y) > self.kick_height_threshold
-                        forward_ok = hip_z_ref is not None and ank_z is not None and (hip_z_ref - ank_z) > self.kick_z_threshold
-
-                        if vertical_ok or forward_ok:
-                            self._cooldown_until[player_id] = now + self.cooldown_seconds
-                            try:
-                                self.callback(player_id, 'kick')
-                                if mc and hasattr(mc, 'set_latest_action'):
-                                    try:
-                                        mc.set_latest_action(player_id, 'KICK')
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
-                            return
-            except Exception:
-                pass
-
-            # JUMP detection
-            baseline = self._hip_baseline[player_id]
-            if hip and baseline is not None:
-                if (baseline - hip[1]) > self.jump_height_threshold:
-                    self._cooldown_until[player_id] = now + self.cooldown_seconds
-                    try:
-                        self.callback(player_id, 'jump')
-                    except Exception:
-                        pass
-                    return
+        wrist = lm[LEFT_WRIST] if player_id == 0 else lm[RIGHT_WRIST]
+        hip = lm[LEFT_HIP] if player_id == 0 else lm[RIGHT_HIP]
 
-            # No action detected for this set of landmarks -> mark READY
-            try:
-                if mc and hasattr(mc, 'set_latest_action'):
-                    try:
-                        mc.set_latest_action(player_id, 'READY')
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        state = self._state[player_id]
 
-        # If a mediapipe_capture singleton exists, poll it for landmarks
-        if self._use_mc:
-            while self._running:
-                try:
-                    latest = None
-                    try:
-                        latest = mc.get_latest_landmarks() if mc else None
-                    except Exception:
-                        latest = None
+        # init baseline
+        if np.isnan(state[STATE_HIP_BASELINE]):
+            state[STATE_HIP_BASELINE] = hip[1]
 
-                    if not latest or not latest.get('landmarks'):
-                        time.sleep(0.01)
-                        continue
+        prev_x = state[STATE_WRIST_X]
+        prev_t = self._last_ns[player_id]
+        self._last_ns[player_id] = now
+        state[STATE_WRIST_X] = wrist[0]
 
-                    lm_list = latest['landmarks']
-                    try:
-                        _run_detection_for_landmarks(lm_list)
-                    except Exception:
-                        pass
+        vel_x = 0.0
+        if prev_t is not None:
+            dt_ns = max(1_000_000, now - prev_t)
+            vel_x = (wrist[0] - prev_x) * 1e9 / dt_ns
 
-                    time.sleep(0.005)
-                except Exception:
-                    time.sleep(0.02)
+        if now < self._cooldown_until_ns[player_id]:
+            self._metrics['cooldown_blocks'] += 1
             return
 
-        # Otherwise open the camera and run Pose on left/right crops
-        cap = cv2.VideoCapture(self.camera_index)
-        if not cap.isOpened():
-            print("ActionDetector: unable to open camera")
-            self._running = False
+        code = _detect_action(lm, player_id, float(vel_x), float(state[STATE_HIP_BASELINE]), self._thresholds)
+        if code == ACTION_SKIP:
             return
 
-        with mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5) as pose:
-            while self._running and cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                h, w = frame.shape[:2]
-                half_w = max(1, w // 2)
-
-                left_crop = frame[:, :half_w]
-                right_crop = frame[:, half_w:]
-
-                # Throttle processing to target FPS to reduce CPU usage.
-                now = time.time()
-                if self.process_fps and self.process_fps > 0:
-                    min_dt = 1.0 / float(self.process_fps)
-                    if (now - self._last_process_time) < min_dt:
-                        # small sleep to avoid busy-looping
-                        time.sleep(0.003)
-                        continue
-                self._last_process_time = now
+        if code == ACTION_NONE:
+            # No action detected for this set of landmarks -> mark READY
+            if self._set_action is not None:
+                self._set_action(player_id, 'READY')
+            return
+
+        self._cooldown_until_ns[player_id] = now + self._cooldown_ns
+        # jumps are not mirrored to the capture overlay
+        self._emit(player_id, ACTION_NAMES[code], mirror=code != ACTION_JUMP)
 
-                # optionally downscale crops before running Pose to reduce cost
+    def _run(self):
+        self._set_action = getattr(mc, 'set_latest_action', None)
+
+        # snapshot thresholds into the kernel's array layout
+        thresholds = self._thresholds
+        thresholds[TH_BLOCK_WRIST_DIST] = self.block_wrist_dist_threshold
+        thresholds[TH_BLOCK_CHEST_Y] = self.block_chest_y_thresh
+        thresholds[TH_PUNCH_DISP] = self.punch_disp_threshold
+        thresholds[TH_PUNCH_VEL] = self.punch_vel_threshold
+        thresholds[TH_ELBOW_COS] = self.elbow_extension_cos_threshold
+        thresholds[TH_KICK_HEIGHT] = self.kick_height_threshold
+        thresholds[TH_KICK_Z] = self.kick_z_threshold
+        thresholds[TH_JUMP_HEIGHT] = self.jump_height_threshold
+        self._cooldown_ns = int(self.cooldown_seconds * 1e9)
+
+        # Wait on the mediapipe_capture singleton for new poses; each pose is
+        # processed once, when its sequence number / frame id first shows up.
+        wait_for_batch = getattr(mc, 'wait_for_landmark_batch', None)
+        # loop-invariant lookups bound once
+        process = self._process_landmarks
+        get_latest = mc.get_latest_landmarks
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
+        record_frame = self._record_frame
+        metrics = self._metrics
+        log_ns = int(self.stats_log_interval * 1e9) if self.stats_log_interval else 0
+        next_log = monotonic_ns() + log_ns
+        last_seq = None
+        while self._running:
+            try:
+                if log_ns and monotonic_ns() >= next_log:
+                    next_log += log_ns
+                    print("ActionDetector: stats", self.stats())
+
+                if wait_for_batch is not None:
+                    # wakes as soon as the capture thread publishes and drains
+                    # every pose published since the last wake, so none are
+                    # dropped if this thread falls behind. The timeout only
+                    # bounds how long stop() waits for this thread.
+                    batch = wait_for_batch(last_seq, 8, 0.1)
+                    if batch is None:
+                        metrics['misses'] += 1
+                        continue
+                    last_seq, lms, stamps = batch
+                    for i in range(lms.shape[0]):
+                        stamp = int(stamps[i])
+                        try:
+                            # capture timestamps keep wrist velocity independent
+                            # of when this thread got scheduled
+                            process(lms[i], stamp)
+                        except Exception as e:
+                            print("ActionDetector: detection failed:", e)
+                        now = monotonic_ns()
+                        record_frame(now, (now - stamp) / 1e6)
+                    continue
+
+                # list-based fallback for capture modules without the batch API
+                latest = None
                 try:
-                    if self.crop_scale and 0.0 < self.crop_scale < 1.0:
-                        left_proc = cv2.resize(left_crop, (0, 0), fx=self.crop_scale, fy=self.crop_scale, interpolation=cv2.INTER_AREA)
-                        right_proc = cv2.resize(right_crop, (0, 0), fx=self.crop_scale, fy=self.crop_scale, interpolation=cv2.INTER_AREA)
-                    else:
-                        left_proc = left_crop
-                        right_proc = right_crop
-
-                    left_rgb = cv2.cvtColor(left_proc, cv2.COLOR_BGR2RGB)
-                    results_l = pose.process(left_rgb)
+                    latest = get_latest()
                 except Exception:
-                    results_l = None
+                    latest = None
 
+                if not latest or not latest.get('landmarks'):
+                    metrics['misses'] += 1
+                    sleep(0.01)
+                    continue
+                frame_id = latest.get('frame_id')
+                if frame_id is not None and frame_id == last_seq:
+                    metrics['misses'] += 1
+                    sleep(0.005)
+                    continue
+                last_seq = frame_id
+                lm = _as_landmark_array(latest['landmarks'])
+
+                now = monotonic_ns()
                 try:
-                    right_rgb = cv2.cvtColor(right_proc, cv2.COLOR_BGR2RGB)
-                    results_r = pose.process(right_rgb)
-                except Exception:
-                    results_r = None
-
-                if results_l and results_l.pose_landmarks:
-                    try:
-                        lm_l = results_l.pose_landmarks.landmark
-                        # include z if available and map x back to full-frame coordinates
-                        lm_list = [((v.x * 0.5), v.y, getattr(v, 'z', None)) for v in lm_l]
-                        _run_detection_for_landmarks(lm_list, assumed_player=0)
-                    except Exception:
-                        pass
-
-                if results_r and results_r.pose_landmarks:
-                    try:
-                        lm_r = results_r.pose_landmarks.landmark
-                        lm_list = [((v.x * 0.5 + 0.5), v.y, getattr(v, 'z', None)) for v in lm_r]
-                        _run_detection_for_landmarks(lm_list, assumed_player=1)
-                    except Exception:
-                        pass
-
-                # small sleep to yield
-                time.sleep(0.001)
-
-        cap.release()
-        # end of multi-crop detection loop
+                    process(lm, now)
+                except Exception as e:
+                    print("ActionDetector: detection failed:", e)
+                # 'ts' is the wall-clock stamp taken when the capture loop
+                # took the frame, before pose inference
+                lag_ms = (time.time() - latest['ts']) * 1000.0 if latest.get('ts') else 0.0
+                record_frame(now, lag_ms)
+
+                sleep(0.005)
+            except Exception:
+                sleep(0.02)
 
 
 __all__ = ["ActionDetector"]
@@ -2,6 +2,7 @@
 
 Place shared colors here so they can be imported across modules.
 """
+from types import MappingProxyType
 
 # Basic
 WHITE = (255, 255, 255)
@@ -50,7 +51,8 @@ HEALTH_BORDER = (200, 200, 200)
 HEALTH_YELLOW = (240, 200, 20)  # warning
 HEALTH_RED = (220, 50, 50)      # critical
 
-COLORS = {
+# read-only name -> color lookup; the proxy stops callers mutating shared colors
+COLORS = MappingProxyType({
     "white": WHITE,
     "black": BLACK,
     "orangeyellow": ORANGEYELLOW,
@@ -76,7 +78,7 @@ COLORS = {
     "capture_base": CAPTURE_BASE,
     "capture_hover": CAPTURE_HOVER,
     "hint_text": HINT_TEXT,
-}
+})
 
 __all__ = [
     "WHITE",
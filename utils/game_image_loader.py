@@ -3,20 +3,86 @@
 Provides a GameImageLoader class that can load multiple images with progress
 reporting. Designed to work with the existing loading UI (report(progress)).
 
-By default the loader uses `pygame.image.load(path).convert_alpha()` to
-produce surfaces. If you need to ensure all Pygame surface operations run on
-the main thread, set `create_surfaces_on_main_thread=True` and call
-`finalize_surfaces()` on the main thread after `load()` completes; in that
-mode the loader will only read raw bytes in the worker thread and keep them
-in memory until finalization.
+By default the loader uses `pygame.image.load(path)` plus `convert_alpha()`
+(or `convert()` for images without alpha) to produce surfaces. If you need
+to ensure all Pygame surface operations run on the main thread, set
+`create_surfaces_on_main_thread=True` and call `finalize_surfaces()` on the
+main thread after `load()` completes; in that mode the worker threads still
+read and decode every file in parallel, but the decoded surfaces are kept
+unconverted until finalization, which only converts pixel formats.
 """
 from __future__ import annotations
 
+import io
+import mmap
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Optional, Callable
 
 import pygame
 
+# files at least this large are decoded straight from a read-only mapping
+_MMAP_THRESHOLD = 256 * 1024
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file with one fstat and size-exact os.read calls.
+
+    Avoids the buffered reader's growing-chunk reads; for regular files this
+    is normally a single read syscall.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) < size:
+            # short read (rare: very large files, some network filesystems)
+            chunks = [data]
+            remaining = size - len(data)
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def _load_image(path: str) -> pygame.Surface:
+    """Decode one image file into an unconverted Surface.
+
+    Large files are memory-mapped and handed to SDL_image as a file object,
+    so the decoder reads from the page cache without a whole-file copy into
+    a Python bytes object; small files take one size-exact read instead.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if os.fstat(fd).st_size < _MMAP_THRESHOLD:
+            data = None
+        else:
+            data = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    if data is None:
+        # pass the path as name hint so SDL_image picks the decoder by extension
+        return pygame.image.load(io.BytesIO(_read_file(path)), path)
+    try:
+        return pygame.image.load(data, path)
+    finally:
+        # SDL_image decodes synchronously, so the mapping is done with here
+        data.close()
+
+
+def _to_display_format(surf: pygame.Surface) -> pygame.Surface:
+    """Convert to the display format, keeping per-pixel alpha only if present."""
+    if surf.get_flags() & pygame.SRCALPHA or surf.get_bitsize() == 32:
+        return surf.convert_alpha()
+    return surf.convert()
+
 
 class GameImageLoader:
     """Load multiple images with progress reporting.
@@ -24,9 +90,11 @@ class GameImageLoader:
     Parameters
     - images: mapping of key->relative path (strings) or list of (key, path)
     - base_dir: optional base directory to join with each path
-    - create_surfaces_on_main_thread: if True, loader will read raw bytes only
-      and postpone Surface creation to `finalize_surfaces()` which must be
-      called on the main thread.
+    - create_surfaces_on_main_thread: if True, loader will decode images off
+      the main thread but postpone pixel-format conversion to
+      `finalize_surfaces()` which must be called on the main thread.
+    - max_workers: how many files are read/decoded concurrently, i.e. the
+      I/O queue depth the loader keeps on the disk
     """
 
     def __init__(
@@ -34,23 +102,34 @@ class GameImageLoader:
         images,
         base_dir: Optional[str] = None,
         create_surfaces_on_main_thread: bool = False,
+        max_workers: int = 8,
     ) -> None:
-        # normalize images to list of (key, path)
-        if isinstance(images, dict):
-            self._items = list(images.items())
-        else:
-            self._items = list(images)
-
         self.base_dir = base_dir or ""
+        # normalize images to list of (key, full path), joined once up front
+        base = self.base_dir
+        pairs = images.items() if isinstance(images, dict) else images
+        self._items = [
+            (key, path if os.path.isabs(path) or not base else os.path.join(base, path))
+            for key, path in pairs
+        ]
+
         self.create_surfaces_on_main_thread = bool(create_surfaces_on_main_thread)
+        self.max_workers = max(1, int(max_workers))
 
         # results
         self.images: Dict[str, pygame.Surface] = {}
-        # if postponing surface creation we keep raw bytes here
-        self._raw_bytes: Dict[str, bytes] = {}
+        # if postponing conversion we keep decoded, unconverted surfaces here
+        self._decoded: Dict[str, pygame.Surface] = {}
 
-    def _full_path(self, path: str) -> str:
-        return path if os.path.isabs(path) or not self.base_dir else os.path.join(self.base_dir, path)
+    def _load_one(self, full: str, is_stopped: Callable[[], bool]):
+        """Read and decode one file into an unconverted Surface; runs on a pool thread.
+
+        File reads and SDL_image decoding release the GIL, so several of these
+        overlap. Returns None if loading was cancelled.
+        """
+        if is_stopped():
+            return None
+        return _load_image(full)
 
     def load(self, report: Optional[Callable[[float], None]] = None, stop_event=None) -> None:
         """Load all images. Call from worker thread via run_loading_with_callback.
@@ -63,60 +142,70 @@ class GameImageLoader:
                 report(100)
             return
 
-        for idx, (key, path) in enumerate(self._items, start=1):
-            if stop_event is not None and getattr(stop_event, "is_set", lambda: False)():
-                break
-
-            full = self._full_path(path)
-            try:
-                if self.create_surfaces_on_main_thread:
-                    # read raw bytes
-                    with open(full, "rb") as f:
-                        data = f.read()
-                    self._raw_bytes[key] = data
-                else:
-                    surf = pygame.image.load(full)
-                    # convert_alpha keeps transparency if present
-                    try:
-                        surf = surf.convert_alpha()
-                    except Exception:
-                        surf = surf.convert()
-                    self.images[key] = surf
-            except Exception:
-                # on error skip but continue; caller can check missing keys
-                print(f"Error loading image '{key}' from path: {full}"  )
+        # decode on a small pool; pixel-format conversion stays on this thread
+        # and results are stored in item order once everything is done
+        results = {}
+        # progress is coalesced: report only when the integer percentage
+        # changes and at most about once per 60 Hz frame
+        last_pct = -1
+        last_t = 0.0
+        is_stopped = getattr(stop_event, "is_set", None) or (lambda: False)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, total)) as pool:
+            futures = {}
+            for key, full in self._items:
+                futures[pool.submit(self._load_one, full, is_stopped)] = (key, full)
+
+            for idx, future in enumerate(as_completed(futures), start=1):
+                key, full = futures[future]
+                try:
+                    value = future.result()
+                    if value is not None and not self.create_surfaces_on_main_thread:
+                        value = _to_display_format(value)
+                    results[key] = value
+                except Exception:
+                    # on error skip but continue; caller can check missing keys
+                    print(f"Error loading image '{key}' from path: {full}"  )
+                    results[key] = False
+
+                if report:
+                    pct = (idx * 100) // total
+                    now = time.monotonic()
+                    if pct != last_pct and now - last_t >= 0.016:
+                        last_pct = pct
+                        last_t = now
+                        report(pct)
+
+        for key, _ in self._items:
+            value = results.get(key)
+            if value is None:
+                # cancelled via stop_event before this item was read
+                continue
+            if value is False:
                 self.images[key] = None  # type: ignore
-
-            if report:
-                pct = int((idx / total) * 100)
-                report(pct)
+            elif self.create_surfaces_on_main_thread:
+                self._decoded[key] = value
+            else:
+                self.images[key] = value
 
         if report:
             report(100)
 
     def finalize_surfaces(self) -> None:
-        """Create pygame.Surface objects from raw bytes.
+        """Convert the decoded surfaces to the display's pixel format.
 
         Must be called on the main thread (the one with the display) if
-        `create_surfaces_on_main_thread=True` was used.
+        `create_surfaces_on_main_thread=True` was used. Decoding already
+        happened on the loader's pool, so this only converts pixel formats.
         """
-        for key, data in self._raw_bytes.items():
+        # pop as we go so each unconverted surface is freed as soon as its
+        # converted copy exists, instead of holding both sets until the end
+        for key in list(self._decoded):
+            surf = self._decoded.pop(key)
             try:
-                import io
-
-                buf = io.BytesIO(data)
-                surf = pygame.image.load(buf)
-                try:
-                    surf = surf.convert_alpha()
-                except Exception:
-                    surf = surf.convert()
-                self.images[key] = surf
+                self.images[key] = _to_display_format(surf)
             except Exception:
                 self.images[key] = None  # type: ignore
 
-        # clear raw bytes to free memory
-        self._raw_bytes.clear()
-
     def get(self, key: str) -> Optional[pygame.Surface]:
         return self.images.get(key)
 
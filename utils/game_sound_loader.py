@@ -5,12 +5,41 @@ Refactored for SOLID principles:
   handles loading and playback of background music.
 - Open/Closed: the loader is configurable (path, volume) and can be extended.
 - Dependency Inversion: accepts configuration rather than hard-coding behavior.
+
+Diagnostics go to the module logger at DEBUG level; to see them on stdout
+call `logging.basicConfig(level=logging.DEBUG)` before starting the game.
 """
 
+import hashlib
+import io
+import logging
 import os
-import pygame
+import tempfile
 from typing import Optional, Callable
 
+logger = logging.getLogger(__name__)
+
+
+def _user_cache_dir() -> str:
+    """Per-user cache directory for 2MB (LOCALAPPDATA on Windows, else XDG)."""
+    try:
+        import platformdirs
+        return platformdirs.user_cache_dir('2MB', appauthor=False)
+    except ImportError:
+        pass
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, '2MB')
+
+
+def _pg():
+    """Import pygame on first use so asset-only tools don't pay for SDL."""
+    import pygame
+
+    return pygame
+
 
 class BackgroundMusicLoader:
     """Loads and controls background music.
@@ -61,13 +90,9 @@ class BackgroundMusicLoader:
 
     def play(self, loop: bool = True) -> None:
         """Start playback. Call on main thread after load completes."""
-        # Debug help: print state so callers can see whether play() was
-        # invoked after a successful finalize(). This is helpful when
-        # diagnosing why no audio is produced on some platforms.
-        try:
-            print(f"BackgroundMusicLoader.play: _loaded={self._loaded}, path={self.path}")
-        except Exception:
-            pass
+        # Debug help: shows whether play() was invoked after a successful
+        # finalize(); formatting is skipped unless DEBUG logging is enabled.
+        logger.debug("play: loaded=%s path=%s", self._loaded, self.path)
 
         if not self._loaded:
             # nothing loaded into mixer
@@ -75,7 +100,7 @@ class BackgroundMusicLoader:
 
         loops = -1 if loop else 0
         try:
-            pygame.mixer.music.play(loops=loops)
+            _pg().mixer.music.play(loops=loops)
         except Exception:
             # best-effort: ignore playback errors and let caller handle logging
             pass
@@ -84,11 +109,13 @@ class BackgroundMusicLoader:
         """Finalize loading on the main thread: initialize mixer and load data.
 
         Must be called on the main thread. Uses the bytes read by `load()` to
-        load into pygame.mixer.music via a BytesIO object.
+        load into pygame.mixer.music via a BytesIO object, or via a reusable
+        cache file in the temp dir when the SDL build rejects file objects.
         """
         if self._raw_bytes is None:
             return
 
+        pygame = _pg()
         # initialize mixer on main thread if requested or if mixer isn't initialized
         try:
             if self.init_mixer:
@@ -104,48 +131,63 @@ class BackgroundMusicLoader:
             pass
 
         try:
-            import io
-            import tempfile
-
             buf = io.BytesIO(self._raw_bytes)
             try:
                 # Try loading from an in-memory buffer first (works on many
                 # pygame builds). If this fails (some SDL builds don't accept
-                # file-like objects), fall back to a temporary file.
+                # file-like objects), fall back to a cache file on disk.
                 pygame.mixer.music.load(buf)
                 pygame.mixer.music.set_volume(self.volume)
                 self._loaded = True
             except Exception:
-                # Fallback: write bytes to a temporary file and load by path.
-                try:
-                    # NamedTemporaryFile on Windows cannot be reopened while open,
-                    # so create a temp file, close it, write, and then load.
-                    tf = tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(self.path)[1])
-                    try:
-                        tf.write(self._raw_bytes)
-                        tf.flush()
-                        tf_name = tf.name
-                    finally:
-                        tf.close()
-                    try:
-                        pygame.mixer.music.load(tf_name)
-                        pygame.mixer.music.set_volume(self.volume)
-                        self._loaded = True
-                    finally:
-                        try:
-                            os.unlink(tf_name)
-                        except Exception:
-                            pass
-                except Exception:
-                    # If fallback fails, re-raise to let caller know finalize
-                    # could not complete.
-                    raise
+                # Fallback: load by path from a content-addressed file in the
+                # per-user cache dir. It is kept (not unlinked) so later
+                # launches reuse it instead of rewriting the whole track.
+                cache = self._ensure_cache_file()
+                pygame.mixer.music.load(cache)
+                pygame.mixer.music.set_volume(self.volume)
+                self._loaded = True
         finally:
             # free raw bytes
             self._raw_bytes = None
 
+    def _ensure_cache_file(self) -> str:
+        """Return a cache file holding exactly the current music bytes.
+
+        The file is named after the bytes' digest and reused only if its
+        content still hashes to that digest. Otherwise it is rewritten via a
+        private temp file in the same directory and swapped in with
+        os.replace, so readers never see a partial file and a planted
+        symlink at the final name is replaced rather than written through.
+        """
+        digest = hashlib.blake2b(self._raw_bytes, digest_size=16).hexdigest()
+        ext = os.path.splitext(self.path)[1]
+        cache_dir = _user_cache_dir()
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        cache = os.path.join(cache_dir, f"bgm_{digest}{ext}")
+
+        try:
+            with open(cache, 'rb') as f:
+                if hashlib.blake2b(f.read(), digest_size=16).hexdigest() == digest:
+                    return cache
+        except OSError:
+            pass
+
+        fd, tmp = tempfile.mkstemp(prefix="bgm_", suffix=ext + ".tmp", dir=cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self._raw_bytes)
+            os.replace(tmp, cache)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return cache
+
     def stop(self) -> None:
-        pygame.mixer.music.stop()
+        _pg().mixer.music.stop()
 
 
 __all__ = ["BackgroundMusicLoader"]
\ No newline at end of file
@@ -1,20 +1,50 @@
 import os
-from typing import List, Optional
+import queue
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Optional
 
 import pygame
 import numpy as np
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# numba is optional: when present the green-screen pass runs as one fused,
+# row-parallel loop; otherwise the numpy version below is used
+try:
+    from numba import njit, prange
+except Exception:
+    njit = None
+    prange = range
+
+# Pillow is optional: when present it decodes GIFs directly to RGB with each
+# frame's own duration; otherwise OpenCV is used as before
+try:
+    from PIL import Image, ImageSequence
+except Exception:
+    Image = None
+    ImageSequence = None
+
 
 class GifPlayer:
-    """Simple GIF player using OpenCV to extract frames.
+    """Simple GIF player using Pillow or OpenCV to extract frames.
 
     Notes:
-    - Requires `opencv-python` (cv2) to be installed. The project already
-      includes opencv in requirements.txt.
+    - Uses Pillow when installed (per-frame GIF durations), otherwise
+      `opencv-python` (cv2), which the project includes in requirements.txt.
     - Loads all frames into memory on init. For short tutorial GIFs this
-      is acceptable; for long GIFs consider streaming frames instead.
-    - Frame timing uses the capture's FPS if available, otherwise falls
-      back to 10 FPS.
+      is acceptable; long GIFs should use StreamingGifPlayer (see
+      `load_gif_player`).
+    - Frame timing uses the GIF's per-frame durations with Pillow, or the
+      capture's FPS with OpenCV, otherwise falls back to 10 FPS.
+    - `smooth_edges=True` fades near-green pixels into per-pixel alpha;
+      False keys out exact (0, 255, 0) with an RLE colorkey instead, which
+      is cheaper to build and to blit but leaves hard edges.
 
     API:
     - update(dt): advance internal timer by seconds (float)
@@ -22,27 +52,53 @@ class GifPlayer:
     - play(), pause(), reset()
     """
 
-    def __init__(self, path: str, loop: bool = True, default_fps: float = 10.0):
+    __slots__ = (
+        "path", "loop", "smooth_edges", "frames", "frame_count", "fps", "frame_duration",
+        "durations", "_cum", "_total", "_uniform_dur", "_time_acc", "_idx", "_playing", "_cur_dur",
+    )
+
+    def __init__(self, path: str, loop: bool = True, default_fps: float = 10.0,
+                 smooth_edges: bool = True):
         self.path = path
         self.loop = loop
+        self.smooth_edges = bool(smooth_edges)
         self.frames: List[pygame.Surface] = []
         self.frame_count = 0
         self.fps = default_fps
         self.frame_duration = 1.0 / self.fps
         # per-frame durations in seconds (may be variable when using PIL)
         self.durations: List[float] = []
+        # prefix sums of `durations` (end time of each frame) and their total;
+        # rebuilt by _ensure_timeline() whenever the frame count changes
+        self._cum: List[float] = []
+        self._total = 0.0
+        # the shared frame duration when every frame lasts the same (always
+        # the case for the OpenCV path), else 0.0; lets update() seek by division
+        self._uniform_dur = 0.0
         self._time_acc = 0.0
         self._idx = 0
         self._playing = True
+        # duration of frame _idx, cached for update()'s no-advance check;
+        # 0.0 means "unknown", which routes the next update() to the full path
+        self._cur_dur = 0.0
 
         if not path or not os.path.exists(path):
             return
 
+        if Image is not None:
+            try:
+                self._load_with_pillow(path)
+                if self.frame_count:
+                    return
+            except Exception as e:
+                print(f"GifPlayer: Pillow failed to load '{path}', trying OpenCV: {e}")
+
         # Use OpenCV (cv2) to load GIF frames. OpenCV is the chosen backend for
         # this project — if cv2 is not available, we fall back to a single-frame
         # pygame.image.load so the scene still shows something.
         try:
-            import cv2
+            if cv2 is None:
+                raise ImportError("No module named 'cv2'")
 
             cap = cv2.VideoCapture(path)
             # try to read fps from the capture; some GIFs may not provide it
@@ -60,37 +116,19 @@ class GifPlayer:
             # For OpenCV path we assume a fixed fps for all frames
             self.frame_duration = 1.0 / self.fps
 
-            frames = []
-            while True:
-                ok, img = cap.read()
-                if not ok:
-                    break
-                # cv2 provides BGR; convert to RGB
-                try:
-                    img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                except Exception:
-                    pass
-
-                h, w = img.shape[:2]
-                surf = pygame.image.frombuffer(img.tobytes(), (w, h), "RGB")
-                # Convert near-green pixels to smooth alpha for cleaner
-                # compositing over the game UI. We prefer per-pixel alpha via
-                # numpy/surfarray; fall back to a simple colorkey if needed.
-                try:
-                    surf = surf.copy()
-                    surf = _apply_green_screen_alpha(surf)
-                except Exception:
-                    try:
-                        try:
-                            surf = surf.convert_alpha()
-                        except Exception:
-                            surf = surf.convert()
-                        surf.set_colorkey((0, 255, 0))
-                    except Exception:
-                        pass
-                frames.append(surf)
-
-            cap.release()
+            def read_frames():
+                while True:
+                    ok, img = cap.read()
+                    if not ok:
+                        return
+                    yield img
+
+            # cap.read() runs on a helper thread, overlapping the keying below
+            try:
+                frames = [_cv2_frame_to_surface(img, self.smooth_edges)
+                          for img in _prefetch(read_frames())]
+            finally:
+                cap.release()
 
             self.frames = frames
             self.frame_count = len(frames)
@@ -105,46 +143,109 @@ class GifPlayer:
         # Final fallback: try pygame.image.load (likely single-frame)
         try:
             surf = pygame.image.load(path)
-            try:
-                surf = surf.convert_alpha()
-            except Exception:
-                surf = surf.convert()
-            # Convert near-green to alpha for smoother edges.
-            try:
-                surf = _apply_green_screen_alpha(surf)
-            except Exception:
-                try:
-                    surf.set_colorkey((0, 255, 0))
-                except Exception:
-                    pass
-            self.frames = [surf]
+            # keying converts to the display format itself, so no separate
+            # convert_alpha() pass is needed first
+            self.frames = [_key_out_green(surf, self.smooth_edges)]
             self.frame_count = 1
             self.durations = [1.0 / default_fps]
             return
         except Exception as e:
             print(f"GifPlayer: failed to load '{path}': {e}")
 
+    def _load_with_pillow(self, path: str) -> None:
+        """Decode every frame with Pillow, keeping each frame's own duration."""
+        default = self.frame_duration
+
+        def decode_frames():
+            # Pillow reuses one image object per file, so hand over an RGB copy
+            with Image.open(path) as im:
+                for frame in ImageSequence.Iterator(im):
+                    yield frame.convert("RGB"), _pil_frame_duration(frame, default)
+
+        # decoding runs on a helper thread, overlapping the keying below
+        frames = []
+        durations = []
+        for rgb, duration in _prefetch(decode_frames()):
+            frames.append(_pil_frame_to_surface(rgb, self.smooth_edges))
+            durations.append(duration)
+
+        self.frames = frames
+        self.frame_count = len(frames)
+        self.durations = durations
+        if durations:
+            self.frame_duration = durations[0]
+            self.fps = 1.0 / self.frame_duration
+
     def is_valid(self) -> bool:
         return bool(self.frames)
 
+    def _ensure_timeline(self) -> None:
+        if len(self._cum) == self.frame_count:
+            return
+        # use per-frame duration if available, otherwise fall back to uniform frame_duration
+        self.durations = [
+            self.durations[i] if i < len(self.durations) else self.frame_duration
+            for i in range(self.frame_count)
+        ]
+        self._cum = list(accumulate(self.durations))
+        self._total = self._cum[-1] if self._cum else 0.0
+        first = self.durations[0] if self.durations else 0.0
+        if first > 0.0 and all(d == first for d in self.durations):
+            self._uniform_dur = first
+            self._total = first * self.frame_count
+        else:
+            self._uniform_dur = 0.0
+
     def update(self, dt: float) -> None:
-        if not self._playing or self.frame_count == 0:
+        if not self._playing:
             return
+        # most calls (60 fps loop, ~10 fps GIF) don't reach the next frame
         self._time_acc += dt
-        # use per-frame duration if available, otherwise fall back to uniform frame_duration
-        while self.frame_count > 0:
-            cur_dur = self.durations[self._idx] if (self.durations and len(self.durations) > self._idx) else self.frame_duration
-            if self._time_acc < cur_dur:
-                break
-            self._time_acc -= cur_dur
-            self._idx += 1
-            if self._idx >= self.frame_count:
-                if self.loop:
-                    self._idx = 0
-                else:
-                    self._idx = self.frame_count - 1
-                    self._playing = False
-                    break
+        if self._time_acc < self._cur_dur:
+            return
+        if self.frame_count == 0:
+            return
+        self._ensure_timeline()
+        acc = self._time_acc
+        cur_dur = self.durations[self._idx]
+        if acc < cur_dur:
+            self._cur_dur = cur_dur
+            return
+
+        # common case: advance exactly one frame
+        nxt = self._idx + 1
+        if nxt < self.frame_count and acc - cur_dur < self.durations[nxt]:
+            self._idx = nxt
+            self._time_acc = acc - cur_dur
+            self._cur_dur = self.durations[nxt]
+            return
+
+        # larger jumps (long frame, window was minimized) or wrapping:
+        # locate the frame on the timeline in O(1) for uniform durations,
+        # otherwise on the cumulative table in O(log N)
+        if self._total <= 0.0:
+            return
+        uniform = self._uniform_dur
+        if uniform:
+            start = self._idx * uniform
+        else:
+            start = self._cum[self._idx - 1] if self._idx else 0.0
+        absolute = start + acc
+        if absolute >= self._total:
+            if not self.loop:
+                self._idx = self.frame_count - 1
+                self._time_acc = absolute - self._total
+                self._cur_dur = 0.0
+                self._playing = False
+                return
+            absolute %= self._total
+        if uniform:
+            self._idx = min(int(absolute // uniform), self.frame_count - 1)
+            self._time_acc = absolute - self._idx * uniform
+        else:
+            self._idx = bisect_right(self._cum, absolute)
+            self._time_acc = absolute - (self._cum[self._idx - 1] if self._idx else 0.0)
+        self._cur_dur = self.durations[self._idx]
 
     def get_surface(self) -> Optional[pygame.Surface]:
         if self.frame_count == 0:
@@ -160,10 +261,350 @@ class GifPlayer:
     def reset(self) -> None:
         self._idx = 0
         self._time_acc = 0.0
+        self._cur_dur = 0.0
         self._playing = True
 
 
-__all__ = ["GifPlayer"]
+class StreamingGifPlayer(GifPlayer):
+    """GifPlayer that decodes frames on demand instead of all up front.
+
+    Only a window of frames starting at the current one is kept in memory;
+    a background thread decodes ahead (Pillow, or OpenCV when Pillow is
+    missing) and evicts frames that fell out of the window, so memory stays
+    O(window) for long GIFs. Call `close()` to stop the decode thread.
+    """
+
+    __slots__ = ("window", "_cache", "_last", "_cv", "_running", "_thread")
+
+    def __init__(self, path: str, loop: bool = True, default_fps: float = 10.0, window: int = 8,
+                 smooth_edges: bool = True):
+        super().__init__("", loop=loop, default_fps=default_fps, smooth_edges=smooth_edges)
+        self.path = path
+        self.window = max(2, int(window))
+        self._cache: Dict[int, pygame.Surface] = {}
+        self._last: Optional[pygame.Surface] = None
+        self._cv = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        if (Image is None and cv2 is None) or not path or not os.path.exists(path):
+            return
+
+        # one pass over the file for timing only; pixels are decoded later
+        try:
+            if Image is not None:
+                with Image.open(path) as im:
+                    durations = [_pil_frame_duration(frame, self.frame_duration)
+                                 for frame in ImageSequence.Iterator(im)]
+            else:
+                # OpenCV only knows one fps for the whole file
+                cap = cv2.VideoCapture(path)
+                try:
+                    n_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+                    fps = cap.get(cv2.CAP_PROP_FPS)
+                finally:
+                    cap.release()
+                durations = [1.0 / fps if fps and fps > 0 else self.frame_duration] * n_frames
+        except Exception as e:
+            print(f"StreamingGifPlayer: failed to read '{path}': {e}")
+            return
+
+        self.durations = durations
+        self.frame_count = len(durations)
+        if durations:
+            self.frame_duration = durations[0]
+            self.fps = 1.0 / self.frame_duration
+            self._running = True
+            self._thread = threading.Thread(target=self._decode_loop, daemon=True)
+            self._thread.start()
+
+    def is_valid(self) -> bool:
+        return self.frame_count > 0
+
+    def _wanted(self, idx: int) -> List[int]:
+        n = self.frame_count
+        if self.loop:
+            return [(idx + i) % n for i in range(min(self.window, n))]
+        return list(range(idx, min(idx + self.window, n)))
+
+    def _open_source(self):
+        """Open the GIF for decoding; return (decode(idx) -> Surface, close)."""
+        if Image is not None:
+            im = Image.open(self.path)
+
+            def decode(idx):
+                im.seek(idx)
+                return _pil_frame_to_surface(im, self.smooth_edges)
+
+            return decode, im.close
+
+        cap = cv2.VideoCapture(self.path)
+        next_pos = [0]
+
+        def decode(idx):
+            # reading ahead is sequential; only seek on a jump or wrap
+            if idx != next_pos[0]:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+            ok, img = cap.read()
+            if not ok:
+                raise ValueError("frame could not be read")
+            next_pos[0] = idx + 1
+            return _cv2_frame_to_surface(img, self.smooth_edges)
+
+        return decode, cap.release
+
+    def _decode_loop(self) -> None:
+        try:
+            decode, close = self._open_source()
+        except Exception as e:
+            print(f"StreamingGifPlayer: failed to open '{self.path}': {e}")
+            with self._cv:
+                self._running = False
+                self._cv.notify_all()
+            return
+
+        try:
+            while True:
+                with self._cv:
+                    while self._running:
+                        wanted = self._wanted(self._idx)
+                        for i in [i for i in self._cache if i not in wanted]:
+                            del self._cache[i]
+                        missing = [i for i in wanted if i not in self._cache]
+                        if missing:
+                            break
+                        self._cv.wait()
+                    if not self._running:
+                        return
+
+                # decode outside the lock so get_surface() never waits on it
+                idx = missing[0]
+                try:
+                    surf = decode(idx)
+                except Exception as e:
+                    print(f"StreamingGifPlayer: failed to decode frame {idx} of '{self.path}': {e}")
+                    with self._cv:
+                        self._running = False
+                        self._cv.notify_all()
+                    return
+
+                with self._cv:
+                    self._cache[idx] = surf
+                    self._cv.notify_all()
+        finally:
+            close()
+
+    def update(self, dt: float) -> None:
+        idx = self._idx
+        super().update(dt)
+        if self._idx != idx:
+            # let the decoder evict the old frame and read further ahead
+            with self._cv:
+                self._cv.notify_all()
+
+    def get_surface(self) -> Optional[pygame.Surface]:
+        if self.frame_count == 0:
+            return None
+        with self._cv:
+            surf = self._cache.get(self._idx)
+            if surf is None and self._running:
+                # decoder fell behind (e.g. after a seek): wait briefly, then
+                # keep showing the previous frame rather than stalling a render
+                self._cv.notify_all()
+                self._cv.wait_for(lambda: self._idx in self._cache or not self._running, timeout=0.05)
+                surf = self._cache.get(self._idx)
+        if surf is not None:
+            self._last = surf
+        return self._last
+
+    def reset(self) -> None:
+        super().reset()
+        with self._cv:
+            self._cv.notify_all()
+
+    def close(self) -> None:
+        with self._cv:
+            self._running = False
+            self._cv.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._cache.clear()
+
+
+def load_gif_player(path: str, loop: bool = True, default_fps: float = 10.0,
+                    max_eager_frames: int = 64, smooth_edges: bool = True) -> GifPlayer:
+    """Return a GifPlayer, or a StreamingGifPlayer for GIFs longer than
+    `max_eager_frames` frames."""
+    if (Image is not None or cv2 is not None) and path and os.path.exists(path):
+        try:
+            if Image is not None:
+                with Image.open(path) as im:
+                    n_frames = getattr(im, "n_frames", 1)
+            else:
+                cap = cv2.VideoCapture(path)
+                try:
+                    n_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+                finally:
+                    cap.release()
+        except Exception:
+            n_frames = 0
+        if n_frames > max_eager_frames:
+            return StreamingGifPlayer(path, loop=loop, default_fps=default_fps, smooth_edges=smooth_edges)
+    return GifPlayer(path, loop=loop, default_fps=default_fps, smooth_edges=smooth_edges)
+
+
+__all__ = ["GifPlayer", "StreamingGifPlayer", "load_gif_player"]
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch(iterable, depth: int = 4):
+    """Yield the items of *iterable*, produced up to *depth* ahead on a thread.
+
+    Lets frame decoding (cv2/Pillow, which release the GIL) overlap with the
+    caller's per-frame work. Errors raised by the producer are re-raised
+    here; leaving the loop early stops and joins the producer.
+    """
+    q = queue.Queue(maxsize=max(1, int(depth)))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((_PREFETCH_DONE, e))
+            return
+        put((_PREFETCH_DONE, None))
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item, error = q.get()
+            if item is _PREFETCH_DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def _pil_frame_duration(frame, default: float) -> float:
+    """Return a Pillow GIF frame's display time in seconds."""
+    # GIF durations are in ms; 0/missing means "as fast as possible",
+    # which viewers render at the default rate
+    duration_ms = frame.info.get("duration") or 0
+    return duration_ms / 1000.0 if duration_ms > 0 else default
+
+
+def _key_out_green(surf: pygame.Surface, smooth_edges: bool = True) -> pygame.Surface:
+    """Make the green screen of *surf* transparent, converting it for display.
+
+    Smooth edges use the per-pixel alpha pass; otherwise (or if that pass
+    fails) exact green becomes an RLE-accelerated colorkey on an opaque
+    surface, which blits through SDL's colorkey path with no alpha blending.
+    """
+    if smooth_edges:
+        try:
+            return _apply_green_screen_alpha(surf)
+        except Exception:
+            pass
+    try:
+        try:
+            surf = surf.convert()
+        except Exception:
+            pass
+        surf.set_colorkey((0, 255, 0), pygame.RLEACCEL)
+    except Exception:
+        pass
+    return surf
+
+
+def _cv2_frame_to_surface(img: np.ndarray, smooth_edges: bool = True) -> pygame.Surface:
+    """Convert an OpenCV BGR frame to a pygame Surface with green-screen alpha."""
+    h, w = img.shape[:2]
+    # wrap the frame's own (fresh, writable) array instead of a
+    # tobytes() copy plus a Surface.copy(); the green-screen pass
+    # below converts into a new per-pixel-alpha surface anyway
+    img = np.ascontiguousarray(img)
+    try:
+        # cv2 provides BGR; pygame >= 2.1.3 reads that layout directly, which
+        # saves a full-frame channel swap (surfarray still sees R, G, B)
+        surf = pygame.image.frombuffer(img, (w, h), "BGR")
+    except ValueError:
+        # older pygame: swap to RGB first
+        try:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        except Exception:
+            pass
+        surf = pygame.image.frombuffer(img, (w, h), "RGB")
+    # Convert near-green pixels to smooth alpha for cleaner
+    # compositing over the game UI, or to a colorkey if requested/needed.
+    return _key_out_green(surf, smooth_edges)
+
+
+def _pil_frame_to_surface(frame, smooth_edges: bool = True) -> pygame.Surface:
+    """Convert a Pillow frame to a pygame Surface with green-screen alpha."""
+    rgb = frame if frame.mode == "RGB" else frame.convert("RGB")
+    # frombuffer wraps the bytes without copying; the green-screen
+    # pass converts to a new per-pixel-alpha surface anyway
+    surf = pygame.image.frombuffer(rgb.tobytes(), rgb.size, "RGB")
+    return _key_out_green(surf, smooth_edges)
+
+
+@lru_cache(maxsize=8)
+def _green_alpha_lut(threshold: int, falloff: int) -> np.ndarray:
+    """Alpha for every G - max(R,B) value in -255..255, indexed by diff + 255.
+
+    Built with the same float32 expression the per-pixel formula used, so the
+    lookup is bit-identical to it.
+    """
+    diff = np.arange(-255, 256, dtype=np.float32)
+    scaled = np.clip((diff - float(threshold)) / float(falloff), 0.0, 1.0)
+    lut = (255.0 * (1.0 - scaled)).astype(np.uint8)
+    lut[diff <= threshold] = 255
+    lut.flags.writeable = False
+    return lut
+
+
+def _green_alpha_kernel(rgb, alpha, lut):
+    """Write lut[G - max(R,B) + 255] into *alpha* for every pixel of *rgb*."""
+    w, h = alpha.shape
+    # surfarray views are (x, y); rows (fixed y) are contiguous in memory
+    for y in prange(h):
+        for x in range(w):
+            r = int(rgb[x, y, 0])
+            g = int(rgb[x, y, 1])
+            b = int(rgb[x, y, 2])
+            alpha[x, y] = lut[g - (r if r > b else b) + 255]
+
+
+if njit is not None:
+    _green_alpha_kernel = njit(cache=True, parallel=True)(_green_alpha_kernel)
+    # numba's default (workqueue) threading layer must not be entered from two
+    # threads at once, and GIFs can be decoded on a streaming thread too
+    _GREEN_KERNEL_LOCK = threading.Lock()
+else:
+    _green_alpha_kernel = None
+
+
+# set once the colorkey fallback below has been reported
+_green_fallback_warned = False
 
 
 def _apply_green_screen_alpha(surf: pygame.Surface, threshold: int = 60, falloff: int = 100) -> pygame.Surface:
@@ -172,8 +613,9 @@ def _apply_green_screen_alpha(surf: pygame.Surface, threshold: int = 60, falloff
     - *threshold* is the minimum (G - max(R,B)) to start fading.
     - *falloff* is the range over which alpha fades to 0 (fully transparent).
 
-    Uses `pygame.surfarray` + numpy for speed; falls back to a per-pixel loop
-    if surfarray access isn't available.
+    Uses `pygame.surfarray` views with a numba kernel (or numpy when numba
+    is missing) for speed; falls back to a plain (0, 255, 0) colorkey if
+    surfarray access isn't available.
     """
     try:
         try:
@@ -185,48 +627,32 @@ def _apply_green_screen_alpha(surf: pygame.Surface, threshold: int = 60, falloff
         arr = pygame.surfarray.pixels3d(surf)  # shape: (w, h, 3)
         alpha = pygame.surfarray.pixels_alpha(surf)  # shape: (w, h)
 
-        # Ensure numpy arrays and use signed ints to avoid underflow
-        r = arr[:, :, 0].astype(np.int16)
-        g = arr[:, :, 1].astype(np.int16)
-        b = arr[:, :, 2].astype(np.int16)
+        lut = _green_alpha_lut(int(threshold), int(falloff))
+        if _green_alpha_kernel is not None:
+            with _GREEN_KERNEL_LOCK:
+                _green_alpha_kernel(arr, alpha, lut)
+        else:
+            # two full-frame temporaries: max(R,B) in uint8, then the signed
+            # green dominance in int16, offset so it indexes the alpha table
+            diff = np.subtract(arr[:, :, 1], np.maximum(arr[:, :, 0], arr[:, :, 2]), dtype=np.int16)
+            diff += 255
 
-        diff = g - np.maximum(r, b)
-
-        # Start fully opaque
-        a = np.full(diff.shape, 255, dtype=np.uint8)
-
-        # Compute mask where green dominance exceeds threshold
-        mask = diff > threshold
-        if mask.any():
-            scaled = (diff.astype(np.float32) - float(threshold)) / float(falloff)
-            scaled = np.clip(scaled, 0.0, 1.0)
-            new_alpha = (255.0 * (1.0 - scaled)).astype(np.uint8)
-            a[mask] = new_alpha[mask]
-
-        # Write back into surface alpha
-        alpha[:, :] = a
+            # Write back into surface alpha straight from the lookup table
+            np.take(lut, diff, out=alpha)
 
         # delete views so pygame unlocks the surface
         del arr
         del alpha
         return surf
-    except Exception:
-        # Fallback: slower per-pixel approach
+    except Exception as e:
+        # Fallback: hard-edged colorkey. A per-pixel get_at/set_at loop would
+        # take seconds per frame and stall the loader, so it is not attempted.
+        global _green_fallback_warned
+        if not _green_fallback_warned:
+            _green_fallback_warned = True
+            print(f"GifPlayer: smooth green-screen alpha unavailable, using a colorkey: {e}")
         try:
-            w, h = surf.get_size()
-            try:
-                surf = surf.convert_alpha()
-            except Exception:
-                pass
-            for x in range(w):
-                for y in range(h):
-                    r, g, b, a = surf.get_at((x, y))
-                    diff = g - max(r, b)
-                    if diff <= threshold:
-                        continue
-                    scaled = min(max((diff - threshold) / float(falloff), 0.0), 1.0)
-                    new_a = int(255 * (1.0 - scaled))
-                    surf.set_at((x, y), (r, g, b, new_a))
+            surf.set_colorkey((0, 255, 0))
         except Exception:
             pass
         return surf
@@ -13,11 +13,41 @@ from __future__ import annotations
 
 import pygame
 import threading
+from functools import lru_cache
 from typing import Tuple, Optional, Callable
 
 from utils.color import BG, TITLE, START_BASE, WHITE, STATUS
 
 
+# translucent center glow per screen size; it never changes between frames
+_GLOW_CACHE: dict = {}
+# pre-rasterized rounded rects for the loading bar, keyed (size, color, radius)
+_BAR_CACHE: dict = {}
+
+
+@lru_cache(maxsize=32)
+def _get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """Return a cached SysFont so the system font scan runs once per (name, size)."""
+    return pygame.font.SysFont(name, size)
+
+
+@lru_cache(maxsize=32)
+def _render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render `text` once per (font, text, color); titles repeat every frame."""
+    return font.render(text, True, color)
+
+
+def _rounded_rect_surface(size: Tuple[int, int], color, border_radius: int) -> pygame.Surface:
+    """Return a cached SRCALPHA surface holding one filled rounded rect."""
+    key = (size, tuple(color), border_radius)
+    surf = _BAR_CACHE.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, flags=pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, surf.get_rect(), border_radius=border_radius)
+        _BAR_CACHE[key] = surf
+    return surf
+
+
 def draw_loading_bar(
     surface: pygame.Surface,
     rect: pygame.Rect,
@@ -31,12 +61,23 @@ def draw_loading_bar(
     progress: 0..100 (will be clamped)
     """
     progress = max(0.0, min(100.0, float(progress)))
-    pygame.draw.rect(surface, bar_bg, rect, border_radius=border_radius)
+    surface.blit(_rounded_rect_surface(rect.size, bar_bg, border_radius), rect)
 
-    inner_w = int((rect.width - 4) * (progress / 100.0))
+    full_w = rect.width - 4
+    inner_h = rect.height - 4
+    inner_w = int(full_w * (progress / 100.0))
     if inner_w > 0:
-        inner_rect = pygame.Rect(rect.x + 2, rect.y + 2, inner_w, rect.height - 4)
-        pygame.draw.rect(surface, bar_color, inner_rect, border_radius=border_radius)
+        x, y = rect.x + 2, rect.y + 2
+        if inner_w < 2 * border_radius or inner_h <= 0:
+            # too narrow to share corners with the full bar; draw it directly
+            pygame.draw.rect(surface, bar_color, pygame.Rect(x, y, inner_w, inner_h), border_radius=border_radius)
+        else:
+            # a rounded rect of any width is the full bar's left part plus its
+            # rounded right end, so both come from one cached surface
+            fill = _rounded_rect_surface((full_w, inner_h), bar_color, border_radius)
+            body_w = inner_w - border_radius
+            surface.blit(fill, (x, y), (0, 0, body_w, inner_h))
+            surface.blit(fill, (x + body_w, y), (full_w - border_radius, 0, border_radius, inner_h))
 
 
 def draw_loading_screen(
@@ -64,26 +105,29 @@ def draw_loading_screen(
     surface.fill(bg_color)
 
     # subtle center glow (a translucent circle) to give depth
-    glow = pygame.Surface((w, h), flags=pygame.SRCALPHA)
-    glow.fill((0, 0, 0, 0))
-    pygame.draw.circle(glow, (255, 255, 255, 12), (w // 2, h // 2), int(min(w, h) * 0.45))
+    glow = _GLOW_CACHE.get((w, h))
+    if glow is None:
+        glow = pygame.Surface((w, h), flags=pygame.SRCALPHA)
+        glow.fill((0, 0, 0, 0))
+        pygame.draw.circle(glow, (255, 255, 255, 12), (w // 2, h // 2), int(min(w, h) * 0.45))
+        _GLOW_CACHE[(w, h)] = glow
     surface.blit(glow, (0, 0))
 
     # fonts
     if title_font is None:
-        title_font = pygame.font.SysFont(None, 56)
+        title_font = _get_font(None, 56)
     if percent_font is None:
-        percent_font = pygame.font.SysFont(None, 32)
+        percent_font = _get_font(None, 32)
 
     # title
-    title_surf = title_font.render(title, True, text_color)
+    title_surf = _render_text(title_font, title, text_color)
     title_rect = title_surf.get_rect(center=(w // 2, h // 2 - 80))
     surface.blit(title_surf, title_rect)
 
     # subtitle
     if subtitle:
-        sub_font = pygame.font.SysFont(None, 28)
-        sub_surf = sub_font.render(subtitle, True, STATUS)
+        sub_font = _get_font(None, 28)
+        sub_surf = _render_text(sub_font, subtitle, STATUS)
         sub_rect = sub_surf.get_rect(center=(w // 2, h // 2 - 40))
         surface.blit(sub_surf, sub_rect)
 
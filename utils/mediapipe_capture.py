@@ -1,18 +1,197 @@
+import collections
+import itertools
+import operator
+import sys
 import threading
 import time
 import cv2
 import mediapipe as mp
+import numpy as np
+from typing import Optional
+
+# a grab() that returns faster than this came from the driver's queue rather
+# than waiting for the sensor, so the frame is already stale
+_QUEUED_GRAB_SECONDS = 0.005
+# upper bound on queued frames skipped before decoding one
+_MAX_STALE_GRABS = 4
+# MediaPipe Pose runs its model on a 256x256 crop, so larger camera frames are
+# shrunk to this longest side before the colour conversion and inference
+_POSE_INPUT_MAX_SIDE = 640
+# cv2.waitKey(1) sleeps at least 1 ms; the preview's 'q' key is only polled
+# (and the HighGUI event queue pumped) on every Nth frame
+_WAITKEY_EVERY = 3
+# pose inference runs on every Nth frame; the frames in between are shown with
+# the previous skeleton, so the preview keeps the camera rate
+_POSE_EVERY = 2
+# idle skip: a frame whose 16x16 thumbnail differs from the one at the last
+# inference by less than this L1 sum (~0.65 levels per value) reuses the
+# previous pose, but never for longer than _IDLE_MAX_SKIP_SECONDS
+_IDLE_THUMB_SIZE = (16, 16)
+_IDLE_MOTION_L1 = 500
+_IDLE_MAX_SKIP_SECONDS = 0.5
+# (x, y, z) of one MediaPipe landmark in a single C-level call
+_LANDMARK_XYZ = operator.attrgetter('x', 'y', 'z')
+# capture size requested from the camera; pose input is capped at 640 anyway
+_CAMERA_SIZE = (640, 480)
+
+
+def _camera_backend():
+    """Native capture backend for this platform, or None for cv2's default."""
+    if sys.platform.startswith('win'):
+        return getattr(cv2, 'CAP_DSHOW', None)
+    if sys.platform.startswith('linux'):
+        return getattr(cv2, 'CAP_V4L2', None)
+    return None
+
+
+def _open_camera(index):
+    """Open `index` with the native backend and ask for 640x480 MJPG.
+
+    Skipping cv2's backend probing speeds up the open (notably on Windows),
+    and MJPG lets USB webcams deliver full frame rate at this size. The
+    driver queue is cut to one frame so reads return the newest image rather
+    than one buffered ~100 ms ago. Falls back to the default backend if the
+    native one can't open the device; the settings are best-effort since
+    some drivers ignore them.
+    """
+    backend = _camera_backend()
+    cap = cv2.VideoCapture(index, backend) if backend is not None else cv2.VideoCapture(index)
+    if backend is not None and not cap.isOpened():
+        cap.release()
+        cap = cv2.VideoCapture(index)
+    if cap.isOpened():
+        try:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, _CAMERA_SIZE[0])
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, _CAMERA_SIZE[1])
+        except Exception:
+            pass
+        try:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        except Exception:
+            pass
+    return cap
+
+
+def _read_latest_frame(cap):
+    """Like cap.read(), but skip frames that were already queued.
+
+    Only the frame that is finally kept gets decoded by retrieve(), so the
+    skipped frames cost no colour conversion.
+    """
+    t0 = time.monotonic()
+    ok = cap.grab()
+    drained = 0
+    while ok and drained < _MAX_STALE_GRABS and time.monotonic() - t0 < _QUEUED_GRAB_SECONDS:
+        t0 = time.monotonic()
+        ok = cap.grab()
+        drained += 1
+    if not ok:
+        return False, None
+    return cap.retrieve()
+
+
+class _FrameSlot:
+    """Single-frame mailbox between the camera reader and the pose loop.
+
+    put() overwrites any frame not yet taken, so the consumer always gets the
+    newest one and latency stays at one frame however slow inference is.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._frame = None
+        self.closed = False
+
+    def put(self, frame):
+        with self._cond:
+            self._frame = frame
+            self._cond.notify()
+
+    def take(self, timeout=None):
+        """Return the newest untaken frame; None on timeout or once closed."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._frame is not None or self.closed, timeout)
+            frame, self._frame = self._frame, None
+            return frame
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+def _pose_input(frame, bufs):
+    """Return the RGB image MediaPipe should process for a BGR camera frame.
+
+    Frames larger than _POSE_INPUT_MAX_SIDE are downscaled first; landmarks
+    are normalized, so they still map onto the full-size frame. `bufs` is a
+    dict owned by the caller that keeps the destination arrays between calls.
+    The returned array is read-only until the next call reuses it.
+    """
+    h, w = frame.shape[:2]
+    scale = _POSE_INPUT_MAX_SIDE / max(h, w)
+    if scale < 1.0:
+        sw, sh = max(1, round(w * scale)), max(1, round(h * scale))
+        small = bufs.get('small')
+        if small is None or small.shape != (sh, sw) + frame.shape[2:]:
+            small = bufs['small'] = np.empty((sh, sw) + frame.shape[2:], dtype=frame.dtype)
+        frame = cv2.resize(frame, (sw, sh), dst=small, interpolation=cv2.INTER_AREA)
+    rgb = bufs.get('rgb')
+    if rgb is None or rgb.shape != frame.shape:
+        rgb = bufs['rgb'] = np.empty_like(frame)
+    rgb.flags.writeable = True
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+    # MediaPipe copies writeable inputs before handing them to its graph;
+    # a read-only image is passed by reference
+    rgb.flags.writeable = False
+    return rgb
 
 
 class _MediapipeCapture:
-    def __init__(self, camera_index=0):
+    def __init__(self, camera_index=0, show_preview=True):
         self.camera_index = camera_index
+        # when False the capture thread skips the OpenCV preview window and
+        # all drawing; the game can render get_latest_frame() itself
+        self.show_preview = show_preview
+        # camera read rate; a faster camera is paced down to this so the
+        # reader sleeps instead of spinning and the game thread gets the CPU
+        self.target_fps = 30
         self._running = False
         self._thread = None
-        # store latest landmarks and a lock for thread-safe access
-        self._latest_lock = threading.Lock()
+        # latest (landmarks, frame_id, width, height, ts) snapshot; published
+        # as one immutable tuple by a single attribute rebind, so readers need
+        # no lock and always see a consistent snapshot
         self._latest = None
-        # latest detected actions per player (player_id -> (action_str, ts))
+        # (seq, (N, 3) float64 array) published by a single reference swap from
+        # the capture thread; readers compare seq to skip frames already seen.
+        # Published arrays are read-only (writeable=False).
+        self._latest_seq = 0
+        self._latest_packet = None
+        # notified whenever a new packet is published so readers can block
+        # instead of polling
+        self._landmarks_cv = threading.Condition()
+        # recent (seq, capture monotonic_ns, landmarks) entries, stamped when
+        # the frame left the reader slot (before inference), so a reader that fell
+        # behind can drain every pose it missed in one call
+        self._history = collections.deque(maxlen=8)
+        # (frame_id, tuple of (x, y, z) tuples) for get_latest_landmarks, so the
+        # array is converted to Python tuples once per pose, not once per call
+        self._tuples_cache = (None, ())
+        # newest camera frame (BGR), published by reference swap like _latest
+        self._latest_frame = None
+        # reused resize/BGR->RGB destinations for _pose_input, reallocated
+        # only when the frame size changes
+        self._pose_bufs = {}
+        # one MediaPipe Pose graph shared by initialize() and the capture loop,
+        # created on first use (loading the models is slow) and closed by stop();
+        # the lock serializes process() calls and creation
+        self._pose = None
+        self._pose_lock = threading.Lock()
+        # latest detected actions per player (player_id -> (action_str, ts),
+        # ts from time.monotonic() so the overlay's expiry ignores clock jumps);
+        # replaced copy-on-write as a whole dict, so readers need no lock and
+        # the lock only keeps concurrent writers from losing updates
         self._actions_lock = threading.Lock()
         self._actions = {0: (None, 0.0), 1: (None, 0.0)}
 
@@ -36,21 +215,57 @@ class _MediapipeCapture:
         # give thread a moment to clean up
         if self._thread:
             self._thread.join(timeout=1.0)
+            if self._thread.is_alive():
+                # still inside process(); it keeps using the shared Pose
+                self._thread = None
+                return
             self._thread = None
+        self._close_pose()
+
+    def _get_pose(self):
+        """Return the shared Pose graph, creating it on first use."""
+        with self._pose_lock:
+            if self._pose is None:
+                self._pose = mp.solutions.pose.Pose(
+                    min_detection_confidence=0.5, min_tracking_confidence=0.5)
+            return self._pose
+
+    def _process_pose(self, img_rgb):
+        pose = self._get_pose()
+        with self._pose_lock:
+            return pose.process(img_rgb)
+
+    def _close_pose(self):
+        with self._pose_lock:
+            pose, self._pose = self._pose, None
+        if pose is not None:
+            try:
+                pose.close()
+            except Exception:
+                pass
 
     def _run(self):
-        cap = cv2.VideoCapture(self.camera_index)
+        cap = _open_camera(self.camera_index)
         if not cap.isOpened():
             print("MediapipeCapture: unable to open camera")
             self._running = False
             return
+        # best-effort: some backends ignore this property
+        try:
+            cap.set(cv2.CAP_PROP_FPS, self.target_fps)
+        except Exception:
+            pass
 
         mp_pose = mp.solutions.pose
         mp_drawing = mp.solutions.drawing_utils
-        with mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5) as pose:
-            window_name = 'Mediapipe Capture - press q to close'
-            # create a named, resizable window and start the window thread to
-            # improve the likelihood the preview appears reliably on Windows
+        # load the models up front; the shared Pose outlives this loop and
+        # is closed by stop()
+        self._get_pose()
+        preview = self.show_preview
+        window_name = 'Mediapipe Capture - press q to close'
+        # create a named, resizable window and start the window thread to
+        # improve the likelihood the preview appears reliably on Windows
+        if preview:
             try:
                 cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
                 try:
@@ -62,17 +277,50 @@ class _MediapipeCapture:
                 # ignore if namedWindow is unsupported on this platform
                 pass
 
-            while self._running and cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    print("MediapipeCapture: frame read failed (ret=False), stopping capture")
+        # a reader thread keeps grabbing frames while pose runs on the
+        # previous one; this loop always takes the newest from the slot
+        slot = _FrameSlot()
+        reader = threading.Thread(target=self._read_frames, args=(cap, slot), daemon=True)
+        reader.start()
+
+        frame_counter = 0
+        last_results = None
+        # thumbnail and monotonic time of the last frame pose ran on
+        pose_thumb = None
+        pose_t = 0.0
+        while self._running:
+            frame = slot.take(timeout=1.0)
+            if frame is None:
+                if slot.closed:
                     break
-
-                # Convert BGR to RGB for mediapipe
+                continue
+            # capture stamps for this frame, taken before inference so the
+            # published times (and detector lag) include pose.process()
+            captured_ns = time.monotonic_ns()
+            captured_ts = time.time()
+
+            run_pose = frame_counter % _POSE_EVERY == 0
+            if run_pose:
+                # skip inference while the scene is still
+                try:
+                    thumb = cv2.resize(frame, _IDLE_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+                    now = time.monotonic()
+                    if (pose_thumb is not None and now - pose_t < _IDLE_MAX_SKIP_SECONDS
+                            and cv2.norm(thumb, pose_thumb, cv2.NORM_L1) < _IDLE_MOTION_L1):
+                        run_pose = False
+                    else:
+                        pose_thumb, pose_t = thumb, now
+                except Exception:
+                    pass
+            if run_pose:
+                # Downscale and convert BGR to RGB for mediapipe
                 try:
-                    img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    img_rgb = _pose_input(frame, self._pose_bufs)
                 except Exception as e:
                     print("MediapipeCapture: cvtColor failed:", e)
+                    self._latest_frame = frame
+                    if not preview:
+                        continue
                     # show the raw frame if possible and continue
                     try:
                         cv2.imshow(window_name, frame)
@@ -84,36 +332,46 @@ class _MediapipeCapture:
                     continue
 
                 try:
-                    results = pose.process(img_rgb)
+                    results = self._process_pose(img_rgb)
                 except Exception as e:
                     # log and keep running; some mediapipe model issues show as warnings
                     print("MediapipeCapture: pose.process() raised:", repr(e))
                     results = None
+                last_results = results
+            else:
+                # reuse the previous skeleton for drawing only; its landmarks
+                # were already published
+                results = last_results
 
-                # Draw landmarks on the original BGR frame and store them
-                try:
-                    if results and getattr(results, 'pose_landmarks', None):
+            # Draw landmarks on the original BGR frame and store them
+            try:
+                if results and getattr(results, 'pose_landmarks', None):
+                    if preview:
                         mp_drawing.draw_landmarks(frame, results.pose_landmarks, mp_pose.POSE_CONNECTIONS)
+                    if run_pose:
                         try:
-                            lm = []
-                            for l in results.pose_landmarks.landmark:
-                                # include z for depth-aware detections (z is relative)
-                                try:
-                                    lm.append((l.x, l.y, l.z))
-                                except Exception:
-                                    lm.append((l.x, l.y))
-                            with self._latest_lock:
-                                self._latest = {
-                                    'landmarks': lm,
-                                    'width': frame.shape[1],
-                                    'height': frame.shape[0],
-                                    'ts': time.time(),
-                                }
+                            # include z for depth-aware detections (z is relative);
+                            # streamed straight into a preallocated array, no
+                            # intermediate list of per-landmark tuples
+                            points = results.pose_landmarks.landmark
+                            lm = np.fromiter(
+                                itertools.chain.from_iterable(map(_LANDMARK_XYZ, points)),
+                                dtype=np.float64, count=3 * len(points),
+                            ).reshape(-1, 3)
+                            # shared zero-copy with every reader below, so freeze it
+                            lm.flags.writeable = False
+                            self._latest_seq += 1
+                            with self._landmarks_cv:
+                                self._latest_packet = (self._latest_seq, lm)
+                                self._history.append((self._latest_seq, captured_ns, lm))
+                                self._landmarks_cv.notify_all()
+                            self._latest = (lm, self._latest_seq, frame.shape[1], frame.shape[0], captured_ts)
                         except Exception:
                             pass
-                except Exception as e:
-                    print("MediapipeCapture: drawing landmarks failed:", e)
+            except Exception as e:
+                print("MediapipeCapture: drawing landmarks failed:", e)
 
+            if preview:
                 try:
                     # draw a vertical divider and labels for left/right halves
                     try:
@@ -126,10 +384,10 @@ class _MediapipeCapture:
 
                     # overlay latest detected actions (if any)
                     try:
-                        with self._actions_lock:
-                            a0, t0 = self._actions.get(0, (None, 0.0))
-                            a1, t1 = self._actions.get(1, (None, 0.0))
-                        now_ts = time.time()
+                        actions = self._actions
+                        a0, t0 = actions.get(0, (None, 0.0))
+                        a1, t1 = actions.get(1, (None, 0.0))
+                        now_ts = time.monotonic()
                         if a0 and (now_ts - t0) < 2.5:
                             cv2.putText(frame, str(a0), (20, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 200, 255), 2)
                         if a1 and (now_ts - t1) < 2.5:
@@ -141,18 +399,29 @@ class _MediapipeCapture:
                 except Exception as e:
                     # ignore imshow errors but log them for diagnosis
                     print("MediapipeCapture: imshow failed:", e)
-
-                # allow quick manual quit from this window
-                try:
-                    if cv2.waitKey(1) & 0xFF == ord('q'):
-                        self._running = False
-                        break
-                except Exception:
-                    # if waitKey fails, break to avoid tight loop
+            # published after drawing so readers never see a half-drawn overlay
+            self._latest_frame = frame
+
+            # no pacing here: the reader thread runs at target_fps, and the
+            # next take() blocks until it has published a newer frame
+            frame_counter += 1
+            if not preview or frame_counter % _WAITKEY_EVERY:
+                continue
+            # allow quick manual quit from this window
+            try:
+                if cv2.waitKey(1) & 0xFF == ord('q'):
                     self._running = False
                     break
-
-            cap.release()
+            except Exception:
+                # if waitKey fails, break to avoid tight loop
+                self._running = False
+                break
+
+        slot.close()
+        reader.join(timeout=1.0)
+        cap.release()
+        self._latest_frame = None
+        if preview:
             try:
                 cv2.destroyWindow(window_name)
             except Exception:
@@ -160,43 +429,140 @@ class _MediapipeCapture:
                     cv2.destroyAllWindows()
                 except Exception:
                     pass
-            try:
-                print("MediapipeCapture: capture loop exited")
-            except Exception:
-                pass
+        try:
+            print("MediapipeCapture: capture loop exited")
+        except Exception:
+            pass
+
+    def _read_frames(self, cap, slot):
+        """Camera reader thread: feed frames into `slot` until either side stops.
+
+        Reads are paced to target_fps; the next read then skips whatever the
+        camera queued meanwhile.
+        """
+        try:
+            while self._running and not slot.closed and cap.isOpened():
+                t_frame = time.perf_counter()
+                ret, frame = _read_latest_frame(cap)
+                if not ret:
+                    print("MediapipeCapture: frame read failed (ret=False), stopping capture")
+                    break
+                slot.put(frame)
+                idle = 1.0 / self.target_fps - (time.perf_counter() - t_frame) if self.target_fps else 0.0
+                if idle > 0:
+                    time.sleep(idle)
+        except Exception as e:
+            print("MediapipeCapture: camera reader failed:", e)
+        finally:
+            slot.close()
+
+    def is_running(self) -> bool:
+        """Return True while the capture thread is publishing landmarks."""
+        return self._running
+
+    def get_latest_frame(self):
+        """Return a copy of the newest camera frame (BGR ndarray) or None.
+
+        Includes the skeleton and labels when the preview window is shown.
+        """
+        frame = self._latest_frame
+        return None if frame is None else frame.copy()
 
     def get_latest_landmarks(self):
         """Return a copy of the latest landmarks dict or None.
 
-        The structure is: {'landmarks': [(x,y[,z]), ...], 'width':int, 'height':int, 'ts': float}
+        The structure is: {'landmarks': [(x,y[,z]), ...], 'frame_id': int, 'width':int, 'height':int, 'ts': float}
+        `frame_id` increases by one per published pose, so pollers can skip
+        landmarks they have already processed.
         Coordinates are normalized (0..1) for x and y; z is included when available
         and represents relative depth (as provided by MediaPipe).
         """
         try:
-            with self._latest_lock:
-                if self._latest is None:
-                    return None
-                # shallow copy is sufficient (list of tuples)
-                return {
-                    'landmarks': list(self._latest['landmarks']),
-                    'width': self._latest['width'],
-                    'height': self._latest['height'],
-                    'ts': self._latest['ts'],
-                }
+            snap = self._latest
+            if snap is None:
+                return None
+            lm, frame_id, width, height, ts = snap
+            # racing callers may both rebuild the tuples; either result is
+            # correct and the cache is swapped in as one tuple
+            cached_id, points = self._tuples_cache
+            if cached_id != frame_id:
+                points = tuple(map(tuple, lm.tolist()))
+                self._tuples_cache = (frame_id, points)
+            # shallow copy is sufficient (list of immutable tuples)
+            return {
+                'landmarks': list(points),
+                'frame_id': frame_id,
+                'width': width,
+                'height': height,
+                'ts': ts,
+            }
         except Exception:
             return None
 
-    def set_latest_action(self, player_id: int, action: str):
+    def get_latest_landmark_array(self):
+        """Return `(seq, landmarks)` for the newest pose, or None.
+
+        `landmarks` is a read-only (N, 3) float64 array of normalized
+        (x, y, z) shared with the capture thread without copying. `seq`
+        increases by one per published pose.
+        """
+        return self._latest_packet
+
+    def wait_for_landmark_array(self, last_seq=None, timeout=None):
+        """Block until a pose newer than `last_seq` is published.
+
+        Returns `(seq, landmarks)` like get_latest_landmark_array, or None if
+        `timeout` seconds pass without a new pose.
+        """
+        with self._landmarks_cv:
+            self._landmarks_cv.wait_for(
+                lambda: self._latest_packet is not None and self._latest_packet[0] != last_seq,
+                timeout,
+            )
+            packet = self._latest_packet
+        if packet is None or packet[0] == last_seq:
+            return None
+        return packet
+
+    def wait_for_landmark_batch(self, since_seq=None, max_n=8, timeout=None):
+        """Block until poses newer than `since_seq` are published, then drain them.
+
+        Returns `(last_seq, landmarks, stamps)` where `landmarks` is a
+        (k, N, 3) array of the k <= max_n newest unseen poses, oldest first,
+        and `stamps` their (k,) int64 time.monotonic_ns() capture times.
+        With `since_seq=None` only the newest pose is returned. Returns None
+        if `timeout` seconds pass without a new pose.
+        """
+        with self._landmarks_cv:
+            self._landmarks_cv.wait_for(
+                lambda: bool(self._history) and self._history[-1][0] != since_seq,
+                timeout,
+            )
+            if since_seq is None:
+                entries = list(self._history)[-1:]
+            else:
+                entries = [e for e in self._history if e[0] > since_seq][-max_n:]
+        if not entries:
+            return None
+        landmarks = np.stack([e[2] for e in entries])
+        stamps = np.fromiter((e[1] for e in entries), dtype=np.int64, count=len(entries))
+        return entries[-1][0], landmarks, stamps
+
+    def set_latest_action(self, player_id: int, action: str, ts: Optional[float] = None):
+        """Record `action` for `player_id`; `ts` is a time.monotonic() stamp (default: now)."""
         try:
+            entry = (str(action).upper() if action else None, time.monotonic() if ts is None else ts)
             with self._actions_lock:
-                self._actions[player_id] = (str(action).upper() if action else None, time.time())
+                actions = dict(self._actions)
+                actions[player_id] = entry
+                self._actions = actions
         except Exception:
             pass
 
     def get_latest_actions(self):
         try:
-            with self._actions_lock:
-                return {k: (v[0], v[1]) for k, v in self._actions.items()}
+            # values are immutable tuples, so a shallow copy is enough
+            return dict(self._actions)
         except Exception:
             return {0: (None, 0.0), 1: (None, 0.0)}
 
@@ -227,9 +593,7 @@ class _MediapipeCapture:
             while waited < max_wait:
                 if stop_event is not None and stop_event.is_set():
                     break
-                with self._latest_lock:
-                    has = self._latest is not None
-                if has:
+                if self._latest is not None:
                     frames_seen += 1
                     try:
                         # report progress as we observe frames
@@ -251,28 +615,27 @@ class _MediapipeCapture:
         if stop_event is not None and stop_event.is_set():
             return
 
-        cap = cv2.VideoCapture(self.camera_index)
+        cap = _open_camera(self.camera_index)
         if not cap.isOpened():
             raise RuntimeError("MediapipeCapture: unable to open camera during initialization")
 
         try:
-            mp_pose = mp.solutions.pose
-            with mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5) as pose:
-                # warm up a few frames
-                frames = 0
-                while frames < 6:
-                    if stop_event is not None and stop_event.is_set():
-                        break
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
-                    img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    _ = pose.process(img_rgb)
-                    frames += 1
-                    try:
-                        report(5.0 + (frames / 6.0) * 90.0)
-                    except Exception:
-                        pass
+            # warm up a few frames; this also loads the models into the shared
+            # Pose so the capture loop started afterwards doesn't reload them
+            frames = 0
+            bufs = {}
+            while frames < 6:
+                if stop_event is not None and stop_event.is_set():
+                    break
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                _ = self._process_pose(_pose_input(frame, bufs))
+                frames += 1
+                try:
+                    report(5.0 + (frames / 6.0) * 90.0)
+                except Exception:
+                    pass
         finally:
             cap.release()
 
@@ -286,8 +649,14 @@ class _MediapipeCapture:
 _instance = _MediapipeCapture()
 
 
-def start_mediapipe_capture():
-    """Start the mediapipe capture in a background thread. Safe to call repeatedly."""
+def start_mediapipe_capture(show_preview=True):
+    """Start the mediapipe capture in a background thread. Safe to call repeatedly.
+
+    show_preview=False skips the OpenCV preview window; it only applies when
+    the capture is not already running.
+    """
+    if not _instance.is_running():
+        _instance.show_preview = show_preview
     _instance.start()
 
 
@@ -296,6 +665,11 @@ def stop_mediapipe_capture():
     _instance.stop()
 
 
+def is_mediapipe_capture_running() -> bool:
+    """Return True while the shared capture thread is running."""
+    return _instance.is_running()
+
+
 def initialize_mediapipe(report, stop_event=None):
     """Module-level loader wrapper that matches the loader signature used
     by utils.loading.run_loading_with_callback.
@@ -309,10 +683,30 @@ def get_latest_landmarks():
     return _instance.get_latest_landmarks()
 
 
-def set_latest_action(player_id: int, action: str):
+def get_latest_frame():
+    """Return a copy of the newest camera frame (BGR ndarray), or None."""
+    return _instance.get_latest_frame()
+
+
+def get_latest_landmark_array():
+    """Return `(seq, landmarks_array)` for the newest pose, or None."""
+    return _instance.get_latest_landmark_array()
+
+
+def wait_for_landmark_array(last_seq=None, timeout=None):
+    """Block until a pose newer than `last_seq` is published; None on timeout."""
+    return _instance.wait_for_landmark_array(last_seq, timeout)
+
+
+def wait_for_landmark_batch(since_seq=None, max_n=8, timeout=None):
+    """Block until poses newer than `since_seq` exist; return (last_seq, landmarks, stamps) or None."""
+    return _instance.wait_for_landmark_batch(since_seq, max_n, timeout)
+
+
+def set_latest_action(player_id: int, action: str, ts: Optional[float] = None):
     """Set the latest detected action for a player (module-level helper)."""
     try:
-        _instance.set_latest_action(player_id, action)
+        _instance.set_latest_action(player_id, action, ts)
     except Exception:
         pass
 
@@ -8,15 +8,28 @@ Design notes:
   0..100 progress value combining image and audio progress.
 - Uses simple weighting (images vs audio) to merge progress; this keeps UI
   feedback smooth without changing underlying loaders.
+- Image and audio loaders run concurrently on a small thread pool.
 """
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Callable
 
 from .game_image_loader import GameImageLoader
 from .game_sound_loader import BackgroundMusicLoader
 import os
 
+try:
+    from pygame.mixer import Sound as _PgSound
+except Exception:
+    _PgSound = None
+
+
+def _path_id(path: str) -> str:
+    """Normalize `path` for lookups (case-insensitive on Windows)."""
+    return os.path.normcase(os.path.normpath(path))
+
 
 class ResourceManager:
     """Load images and audio resources and provide accessors.
@@ -29,6 +42,15 @@ class ResourceManager:
                  audio_path: Optional[str] = None, audio_files: Optional[Dict[str, str]] = None):
         self.images_map = images
         self.image_base_dir = image_base_dir
+        # normalized full path -> key, so get_image_by_path is one dict lookup
+        self._path_to_key: Dict[str, str] = {}
+        for key, rel in images.items():
+            try:
+                full = rel if os.path.isabs(rel) or not image_base_dir else os.path.join(image_base_dir, rel)
+                # first key wins, matching the old in-order scan
+                self._path_to_key.setdefault(_path_id(full), key)
+            except Exception:
+                continue
 
         # create loaders
         self.image_loader = GameImageLoader(
@@ -43,57 +65,60 @@ class ResourceManager:
         if audio_files:
             self.audio_loaders = {k: BackgroundMusicLoader(path=v) for k, v in (audio_files.items())}
 
+        # short sound effects loaded by get_sound; the lock makes concurrent
+        # misses for the same path load it only once
+        self._sfx_cache = {}
+        self._sfx_lock = threading.Lock()
+
     def load_all(self, report: Optional[Callable[[float], None]] = None, stop_event=None) -> None:
         """Load images and audio, reporting combined progress (0..100).
 
-        Strategy: load images first then audio. Weighting: images 70%, audio 30%.
-        Calls `report(combined_percent)` where combined_percent is 0..100.
+        Strategy: images and every audio file load concurrently, since disk
+        reads and decoding release the GIL; wall time is the slowest loader
+        rather than the sum. Weighting: images 70%, audio 30% (split evenly
+        between named audio loaders). Calls `report(combined_percent)` where
+        combined_percent is 0..100. Re-raises the first loader error.
         """
         # weights
         img_weight = 0.7
         audio_weight = 0.3
 
-        # helper to convert subprogress to combined
-        def report_images(pct: float):
-            if report:
-                report(int(pct * img_weight))
-
-        def report_audio(pct: float):
-            if report:
-                # offset by image weight
-                combined = int(img_weight * 100 + pct * audio_weight)
-                report(min(100, combined))
-
-        # load images
-        self.image_loader.load(report=report_images, stop_event=stop_event)
-
-        # load audio: either a single loader or multiple named loaders
+        # (load method, weight) for every loader to run
+        jobs = [(self.image_loader.load, img_weight)]
         if self.audio_loader:
-            self.audio_loader.load(report=report_audio, stop_event=stop_event)
+            jobs.append((self.audio_loader.load, audio_weight))
         elif self.audio_loaders:
-            # split the audio weight between each named loader for smooth progress
-            keys = list(self.audio_loaders.keys())
-            n = len(keys)
-
-            def per_loader_report(idx, pct):
-                # compute combined percent: image_weight*100 + audio_weight*(idx/n + pct/n)
-                if report:
-                    base = int(img_weight * 100)
-                    frac = (idx + pct / 100.0) / n
-                    combined = int(base + frac * audio_weight * 100)
-                    report(min(100, combined))
-
-            for i, k in enumerate(keys):
-                loader = self.audio_loaders[k]
-                # wrapper to convert 0..100->0..100 for per_loader_report
-                def make_report(i):
-                    return lambda p: per_loader_report(i, p)
-
-                loader.load(report=make_report(i), stop_event=stop_event)
-        else:
-            if report:
-                # nothing to load for audio
-                report(100)
+            share = audio_weight / len(self.audio_loaders)
+            jobs.extend((loader.load, share) for loader in self.audio_loaders.values())
+        # nothing to load for audio: its share counts as done
+        base = 0.0 if len(jobs) > 1 else audio_weight * 100
+
+        # per-loader progress (0..100); loaders report from their own threads,
+        # so the total is computed under the lock and only values above the
+        # last one reported go out, which keeps the callback monotonic in the
+        # usual case while it runs outside the lock
+        progress = [0.0] * len(jobs)
+        progress_lock = threading.Lock()
+        last_reported = [-1]
+
+        def make_report(i: int):
+            def sub_report(pct: float):
+                if not report:
+                    return
+                with progress_lock:
+                    progress[i] = pct
+                    combined = min(100, int(base + sum(p * w for p, (_, w) in zip(progress, jobs))))
+                    if combined <= last_reported[0]:
+                        return
+                    last_reported[0] = combined
+                report(combined)
+            return sub_report
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = [pool.submit(load, report=make_report(i), stop_event=stop_event)
+                       for i, (load, _) in enumerate(jobs)]
+            for fut in futures:
+                fut.result()
 
     # Accessors
     def get_image(self, key: str):
@@ -105,44 +130,40 @@ class ResourceManager:
         the path (not the resource key) to reuse already-loaded surfaces.
 
         Path matching is done by normalizing paths and joining with the
-        configured image_base_dir when the stored path is relative.
+        configured image_base_dir when the stored path is relative; the
+        normalized paths are indexed once in `__init__`.
         """
         if not path:
             return None
 
-        # normalize requested path
         try:
-            req = os.path.normpath(path)
+            key = self._path_to_key.get(_path_id(path))
         except Exception:
-            req = path
-
-        for key, rel in self.images_map.items():
-            try:
-                full = rel if os.path.isabs(rel) or not self.image_base_dir else os.path.join(self.image_base_dir, rel)
-                if os.path.normpath(full) == req:
-                    return self.image_loader.get(key)
-            except Exception:
-                continue
-
-        return None
+            return None
+        return self.image_loader.get(key) if key is not None else None
 
     # Simple sound cache for short sound effects (pygame.mixer.Sound)
     # This is intentionally minimal: it synchronously loads the sound the
     # first time it is requested and caches the resulting Sound object.
     # Use `get_sound(path)` with a filesystem path (or a key you choose).
     def get_sound(self, path: str):
-        if not hasattr(self, '_sfx_cache'):
-            self._sfx_cache = {}
-
-        if path in self._sfx_cache:
-            return self._sfx_cache[path]
+        snd = self._sfx_cache.get(path)
+        if snd is not None:
+            return snd
 
-        try:
-            snd = __import__('pygame').mixer.Sound(path)
+        with self._sfx_lock:
+            snd = self._sfx_cache.get(path)
+            if snd is not None:
+                return snd
+            if _PgSound is None:
+                return None
+            try:
+                snd = _PgSound(path)
+            except Exception:
+                # not cached, so a later call retries (e.g. once the mixer is up)
+                return None
             self._sfx_cache[path] = snd
             return snd
-        except Exception:
-            return None
 
     def play_music(self):
         print("ResourceManager: play_music called")
@@ -8,8 +8,11 @@ DEFAULTS = {
     'num_colors': 16
 }
 
+# merged settings from the last read/save; None until first loaded
+_cache = None
 
-def load_settings():
+
+def _read_settings():
     try:
         if os.path.exists(SETTINGS_FILE):
             with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
@@ -23,12 +26,34 @@ def load_settings():
     return DEFAULTS.copy()
 
 
+def load_settings():
+    """Return a copy of the settings; the file is read once and cached."""
+    global _cache
+    if _cache is None:
+        _cache = _read_settings()
+    return _cache.copy()
+
+
+def reload_settings():
+    """Drop the cached settings and read SETTINGS_FILE again."""
+    global _cache
+    _cache = None
+    return load_settings()
+
+
 def save_settings(d: dict):
+    """Merge `d` into the settings and write them atomically."""
+    global _cache
     try:
         cur = load_settings()
         cur.update(d or {})
-        with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
+        # write a temp file then swap it in, so a crash mid-write can't leave
+        # a truncated settings.json behind
+        tmp = SETTINGS_FILE + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
             json.dump(cur, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, SETTINGS_FILE)
+        _cache = cur
         return True
     except Exception:
         return False
@@ -3,12 +3,67 @@
 Provides reusable UI drawing functions such as draw_button.
 """
 import pygame
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import List, Tuple, Optional
 
 from utils.color import WHITE
 from utils.color import HEALTH, HEALTH_BG, HEALTH_BORDER, HEALTH_YELLOW, HEALTH_RED
 
 
+def _cache_surface(surf: pygame.Surface) -> pygame.Surface:
+    """Convert a surface about to be cached to the display's pixel format.
+
+    Blits between matching formats take pygame's SIMD fast paths. Surfaces
+    with per-pixel alpha keep it; without a display the surface is returned
+    unchanged.
+    """
+    try:
+        if surf.get_flags() & pygame.SRCALPHA:
+            return surf.convert_alpha()
+        return surf.convert()
+    except pygame.error:
+        return surf
+
+
+@lru_cache(maxsize=512)
+def _render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Antialiased `font.render`, cached per (font, text, color).
+
+    The returned surface is shared; blit it, don't draw on it.
+    """
+    return _cache_surface(font.render(text, True, color))
+
+
+@lru_cache(maxsize=256)
+def _button_bg(size: Tuple[int, int], color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+    """Rounded-rect button background of `size`, cached per (size, color, radius)."""
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surf, color, surf.get_rect(), border_radius=radius)
+    return _cache_surface(surf)
+
+
+# shared font for Buttons created without one; SysFont is resolved on first use
+_DEFAULT_FONT: Optional[pygame.font.Font] = None
+
+
+def _default_font() -> pygame.font.Font:
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        _DEFAULT_FONT = pygame.font.SysFont(None, 36)
+    return _DEFAULT_FONT
+
+
+def _centered_pos(surf: pygame.Surface, rect: pygame.Rect) -> Tuple[int, int]:
+    """Top-left that centers `surf` on `rect`; same as get_rect(center=...) without the Rect."""
+    w, h = surf.get_size()
+    return rect.centerx - (w >> 1), rect.centery - (h >> 1)
+
+
+def clear_text_cache():
+    """Forget cached label renders, e.g. after changing a font's style."""
+    _render_text.cache_clear()
+
+
 def draw_button(
     surface: pygame.Surface,
     rect: pygame.Rect,
@@ -34,13 +89,9 @@ def draw_button(
     - border_radius: corner radius for rectangle
     """
     color = hover_color if rect.collidepoint(mouse_pos) else base_color
-    pygame.draw.rect(surface, color, rect, border_radius=border_radius)
-    txt_surf = font.render(text, True, text_color)
-    txt_rect = txt_surf.get_rect(center=rect.center)
-    surface.blit(txt_surf, txt_rect)
-
-
-__all__ = ["draw_button"]
+    surface.blit(_button_bg(rect.size, tuple(color), border_radius), rect)
+    txt_surf = _render_text(font, text, tuple(text_color))
+    surface.blit(txt_surf, _centered_pos(txt_surf, rect))
 
 
 class Button:
@@ -52,34 +103,75 @@ class Button:
     - Detect clicks
     """
 
+    __slots__ = ("rect", "text", "font", "base_color", "hover_color", "image",
+                 "_baked_key", "_base_surf", "_hover_surf")
+
     def __init__(self, rect: pygame.Rect, text: str = "", font: Optional[pygame.font.Font] = None,
                  base_color=(30, 144, 255), hover_color=(65, 150, 255), image: Optional[pygame.Surface] = None):
         self.rect = rect
         self.text = text
-        self.font = font or pygame.font.SysFont(None, 36)
+        self.font = font or _default_font()
         self.base_color = base_color
         self.hover_color = hover_color
         self.image = image
+        # pre-rendered surfaces and the state they were rendered from; rebuilt
+        # when text, colors, font, image or size change (see _baked)
+        self._baked_key = None
+        self._base_surf = None
+        self._hover_surf = None
 
-    def draw(self, surface: pygame.Surface, mouse_pos):
-        if self.image:
-            # Scale the provided image to the button rectangle so it fits the button size.
-            # We use smoothscale for a nicer result; this will stretch the image to fill the
-            # rect. If you prefer to preserve aspect ratio, we can change this to fit + letterbox.
-            try:
-                img_surf = pygame.transform.smoothscale(self.image, (self.rect.width, self.rect.height))
-                img_rect = img_surf.get_rect(center=self.rect.center)
-                surface.blit(img_surf, img_rect)
-            except Exception:
-                # If scaling fails for any reason, fall back to blitting the original image
+    def _bake(self, color) -> pygame.Surface:
+        """Render the rounded background and centered label into one surface."""
+        txt_surf = _render_text(self.font, self.text, WHITE)
+        # grown to fit a label wider than the button, which draw_button lets overflow
+        size = (max(self.rect.width, txt_surf.get_width()), max(self.rect.height, txt_surf.get_height()))
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        bg_rect = pygame.Rect((0, 0), self.rect.size)
+        bg_rect.center = surf.get_rect().center
+        pygame.draw.rect(surf, color, bg_rect, border_radius=8)
+        surf.blit(txt_surf, txt_surf.get_rect(center=bg_rect.center))
+        return _cache_surface(surf)
+
+    def _baked(self):
+        """Return the (base, hover) surfaces, re-rendering only when stale.
+
+        Image buttons get their scaled image for both states.
+        """
+        key = (self.text, self.font, self.base_color, self.hover_color, self.image, self.rect.size)
+        if key != self._baked_key:
+            if self.image:
+                # Scale the provided image to the button rectangle so it fits the button size.
+                # We use smoothscale for a nicer result; this will stretch the image to fill the
+                # rect. If you prefer to preserve aspect ratio, we can change this to fit + letterbox.
                 try:
-                    img_rect = self.image.get_rect(center=self.rect.center)
-                    surface.blit(self.image, img_rect)
+                    img_surf = _cache_surface(
+                        pygame.transform.smoothscale(self.image, (self.rect.width, self.rect.height)))
                 except Exception:
-                    # swallow errors to avoid crashing UI
-                    pass
-        else:
-            draw_button(surface, self.rect, self.text, self.font, self.base_color, self.hover_color, mouse_pos)
+                    # If scaling fails for any reason, fall back to the original image
+                    img_surf = self.image
+                self._base_surf = self._hover_surf = img_surf
+            else:
+                self._base_surf = self._bake(self.base_color)
+                self._hover_surf = self._bake(self.hover_color)
+            self._baked_key = key
+        return self._base_surf, self._hover_surf
+
+    def draw(self, surface: pygame.Surface, mouse_pos):
+        # a failed smoothscale is already handled inside _baked
+        base, hover = self._baked()
+        img = hover if self.rect.collidepoint(mouse_pos) else base
+        surface.blit(img, _centered_pos(img, self.rect))
+
+    def draw_sequence(self, hovered: bool) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Return the (surface, dest) pairs that draw this button.
+
+        Lets a scene gather several buttons and submit them with one
+        `Surface.blits` call instead of one `draw` call per button. `hovered`
+        is computed by the caller so the mouse is queried once per frame.
+        """
+        base, hover = self._baked()
+        img = hover if hovered else base
+        return [(img, _centered_pos(img, self.rect))]
 
     def handle_event(self, event) -> bool:
         """Return True if clicked."""
@@ -89,6 +181,68 @@ class Button:
         return False
 
 
+def draw_buttons(surface: pygame.Surface, buttons, mouse_pos: Tuple[int, int]) -> None:
+    """Draw several Buttons with one batched blit call.
+
+    Gathers every button's `draw_sequence` and submits them together via
+    `Surface.fblits` (pygame-ce) or `Surface.blits`.
+    """
+    seq = []
+    for button in buttons:
+        seq.extend(button.draw_sequence(button.rect.collidepoint(mouse_pos)))
+    fblits = getattr(surface, 'fblits', None)
+    if fblits is not None:
+        fblits(seq)
+    else:
+        surface.blits(seq, doreturn=False)
+
+
+@lru_cache(maxsize=32)
+def _health_bar_bg(size: Tuple[int, int], bg_color, border_color, border_radius: int) -> pygame.Surface:
+    """Static part of a health bar (border + empty background), cached per look."""
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    outer = surf.get_rect()
+    # outer border
+    pygame.draw.rect(surf, border_color, outer, border_radius=border_radius)
+    # inner background (shrink by 2 px to show border)
+    pygame.draw.rect(surf, bg_color, outer.inflate(-4, -4), border_radius=max(0, border_radius - 1))
+    return _cache_surface(surf)
+
+
+# default bar color per whole percent: red below 30%, yellow below 50%
+_HEALTH_LUT = tuple(HEALTH_RED if p < 30 else HEALTH_YELLOW if p < 50 else HEALTH for p in range(101))
+
+
+def _health_fill(width: int, current: float, maximum: float, fg_color):
+    """Return (filled width in px out of `width`, fill color) for a health bar.
+
+    Integer HP stays in integer arithmetic; floats go through the fraction.
+    """
+    if not maximum or maximum <= 0:
+        cur, maximum = 0, 1
+    else:
+        cur = min(max(current, 0), maximum)
+    if isinstance(cur, int) and isinstance(maximum, int):
+        fill_w = width * cur // maximum
+        pct_i = 100 * cur // maximum
+    else:
+        pct = float(cur) / float(maximum)
+        fill_w = int(width * pct)
+        pct_i = int(pct * 100)
+
+    # dynamic foreground color when caller uses default HEALTH
+    fg = _HEALTH_LUT[pct_i] if fg_color == HEALTH else fg_color
+    return max(0, fill_w), fg
+
+
+def _fill_rect(surface: pygame.Surface, color, rect: pygame.Rect, radius: int):
+    """Fill `rect`, using SDL's FillRect when there are no rounded corners."""
+    if radius <= 0:
+        surface.fill(color, rect)
+    else:
+        pygame.draw.rect(surface, color, rect, border_radius=radius)
+
+
 def draw_health_bar(
     surface: pygame.Surface,
     rect: pygame.Rect,
@@ -103,38 +257,46 @@ def draw_health_bar(
 
     - `current` and `maximum` can be ints or floats. Values are clamped.
     - Bar fills from left to right.
+    - The border and background come from a cached surface; for a bar drawn
+      every frame at a fixed place, `HealthBarRenderer` also keeps its rects.
+    - An empty `rect` draws nothing; `maximum <= 0` draws an empty bar.
+    """
+    if rect.width <= 0 or rect.height <= 0:
+        return
+    surface.blit(_health_bar_bg(rect.size, tuple(bg_color), tuple(border_color), border_radius), rect)
+
+    # filled portion
+    inner = rect.inflate(-4, -4)
+    fill_w, fg = _health_fill(inner.width, current, maximum, fg_color)
+    if fill_w > 0:
+        inner.width = fill_w
+        _fill_rect(surface, fg, inner, border_radius - 1)
+
+
+class HealthBarRenderer:
+    """Health bar at a fixed `rect`, drawn like `draw_health_bar`.
+
+    Keeps the border/background surface and the inner rects between frames,
+    so each draw is one blit plus one `draw.rect` for the fill.
     """
-    try:
-        pct = 0.0
-        if maximum and maximum > 0:
-            pct = max(0.0, min(1.0, float(current) / float(maximum)))
-
-        # dynamic foreground color when caller uses default HEALTH
-        if fg_color == HEALTH:
-            if pct < 0.3:
-                fg = HEALTH_RED
-            elif pct < 0.5:
-                fg = HEALTH_YELLOW
-            else:
-                fg = HEALTH
-        else:
-            fg = fg_color
 
-        # outer border
-        pygame.draw.rect(surface, border_color, rect, border_radius=border_radius)
+    def __init__(self, rect: pygame.Rect, fg_color=HEALTH, bg_color=HEALTH_BG,
+                 border_color=HEALTH_BORDER, border_radius: int = 4):
+        self.rect = pygame.Rect(rect)
+        self.fg_color = fg_color
+        self.border_radius = border_radius
+        self._bg = _health_bar_bg(self.rect.size, tuple(bg_color), tuple(border_color), border_radius)
+        self._inner = self.rect.inflate(-4, -4)
+        self._fill = pygame.Rect(self._inner)
 
-        # inner background (shrink by 2 px to show border)
-        inner = rect.inflate(-4, -4)
-        pygame.draw.rect(surface, bg_color, inner, border_radius=max(0, border_radius - 1))
+    def draw(self, surface: pygame.Surface, current: float, maximum: float):
+        surface.blit(self._bg, self.rect)
 
         # filled portion
-        fill_w = max(0, int(inner.width * pct))
+        fill_w, fg = _health_fill(self._inner.width, current, maximum, self.fg_color)
         if fill_w > 0:
-            fill_rect = pygame.Rect(inner.x, inner.y, fill_w, inner.height)
-            pygame.draw.rect(surface, fg, fill_rect, border_radius=max(0, border_radius - 1))
-    except Exception:
-        # don't crash UI if drawing fails
-        pass
+            self._fill.width = fill_w
+            _fill_rect(surface, fg, self._fill, self.border_radius - 1)
 
 
-__all__ = ["draw_button", "Button", "draw_health_bar"]
+__all__ = ["draw_button", "Button", "draw_buttons", "draw_health_bar", "HealthBarRenderer", "clear_text_cache"]